@@ -0,0 +1,110 @@
+"""
+Headless benchmark runner for the lab experiments.
+
+    python -m benchmark --list
+    python -m benchmark bfs dijkstra --out plots
+    python -m benchmark all
+
+Each experiment runs in this process; its plots are rendered to PNG files by a
+background process with a non-interactive matplotlib backend, so the next
+experiment starts immediately and nothing ever waits on a GUI window.
+"""
+import argparse
+import importlib
+import os
+import sys
+from multiprocessing import Process
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# name -> (lab directory, module, function returning the plot_results arguments)
+EXPERIMENTS = {
+    "fib-recursive": ("lab1", "recurssive_method", "collect_results"),
+    "fib-memoization": ("lab1", "memoization_approach", "collect_results"),
+    "fib-dynamic-programming": ("lab1", "dynamic_programming_method", "collect_results"),
+    "fib-space-optimized": ("lab1", "space_optimized_approach", "collect_results"),
+    "fib-matrix-power": ("lab1", "matrix_power", "collect_results"),
+    "fib-binet": ("lab1", "binet_formula_method", "collect_results"),
+    "sorting": ("lab2", "main", "perform_analysis"),
+    "bfs": ("lab3", "bfs", "analyze_bfs_performance"),
+    "dfs": ("lab3", "dfs", "analyze_dfs_performance"),
+    "dijkstra": ("lab4", "dijkstra", "collect_results"),
+    "floyd-warshall": ("lab4", "floyd–warshall", "collect_results"),
+    "priority-queues": ("lab4", "priority_queues", "collect_results"),
+    "contraction-hierarchy": ("lab4", "contraction_hierarchy", "collect_results"),
+    "kruskal": ("lab5", "kruskal", "collect_results"),
+    "prim": ("lab5", "prim", "collect_results"),
+}
+
+
+def load_module(lab, module_name):
+    """Import a lab script as a module (lab scripts import their siblings by plain name)"""
+    lab_dir = os.path.join(ROOT, lab)
+    if lab_dir not in sys.path:
+        sys.path.insert(0, lab_dir)
+    return importlib.import_module(module_name)
+
+
+def render(lab, module_name, results, output_dir):
+    """
+    Background process body: draw one experiment's plots and save them into
+    output_dir. plot_results only draws; every figure it opens is named after
+    its PNG file and saved here (a lab script run directly shows them instead).
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    module = load_module(lab, module_name)
+    module.plot_results(*results)
+    for label in plt.get_figlabels():
+        plt.figure(label).savefig(os.path.join(output_dir, label + ".png"))
+    plt.close("all")
+
+
+def run(names, output_dir):
+    os.makedirs(output_dir, exist_ok=True)
+    renderers = []
+    for name in names:
+        lab, module_name, collect = EXPERIMENTS[name]
+        print(f"=== {name} ({lab}/{module_name}.py)")
+        results = getattr(load_module(lab, module_name), collect)()
+        if not isinstance(results, tuple):
+            results = (results,)
+        renderer = Process(target=render, args=(lab, module_name, results, output_dir))
+        renderer.start()
+        renderers.append((name, renderer))
+
+    failed = []
+    for name, renderer in renderers:
+        renderer.join()
+        if renderer.exitcode != 0:
+            failed.append(name)
+    if failed:
+        print(f"Plotting failed for: {', '.join(failed)}")
+        return 1
+    print(f"Plots written to {output_dir}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmark", description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("experiments", nargs="*", help="experiment names, or 'all'")
+    parser.add_argument("--out", default="plots", help="directory for the PNG files (default: plots)")
+    parser.add_argument("--list", action="store_true", help="list the available experiments")
+    args = parser.parse_args(argv)
+
+    if args.list or not args.experiments:
+        for name, (lab, module_name, _) in EXPERIMENTS.items():
+            print(f"{name:<26} {lab}/{module_name}.py")
+        return 0
+
+    names = list(EXPERIMENTS) if args.experiments == ["all"] else args.experiments
+    unknown = [name for name in names if name not in EXPERIMENTS]
+    if unknown:
+        parser.error(f"unknown experiment(s): {', '.join(unknown)}")
+    return run(names, args.out)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,5 @@
 import time
 import tracemalloc
-import matplotlib.pyplot as plt
-import numpy as np
 
 
 def matrix_multiply(A, B, m):
@@ -54,51 +52,64 @@ def nth_fibonacci(n):
 # Generate test series with exponential growth
 first_series = [2 ** i for i in range(5, 25)]  # From 2^5 to 2^24
 
-# Lists to store measurements
-time_taken = []
-space_used = []
-
-# Compute Fibonacci numbers and measure performance
-for num in first_series:
-    # Take multiple measurements for each n
-    times = []
-    peaks = []
-    for _ in range(5):  # Run 5 times for each number
-        tracemalloc.start()
-        start_time = time.time()
-        nth_fibonacci(num)
-        end_time = time.time()
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-        times.append(end_time - start_time)
-        peaks.append(peak)
-
-    # Use the minimum time and average memory to reduce impact of system variations
-    elapsed_time = min(times)
-    avg_memory = sum(peaks) / len(peaks) / 1024  # Convert to KB
-    time_taken.append(elapsed_time)
-    space_used.append(avg_memory)
-    print(f"Fibonacci({num}) computed in {elapsed_time:.6f} seconds, Peak Memory Usage: {avg_memory:.2f} KB")
-
-# Plot time complexity
-plt.figure(figsize=(10, 6))
-plt.loglog(first_series, time_taken, 'bo-', label='Actual time')
-ref_log = [time_taken[0] * np.log2(x) / np.log2(first_series[0]) for x in first_series]
-plt.grid(True)
-plt.xlabel('n (log scale)')
-plt.ylabel('Time (seconds, log scale)')
-plt.title('Time Complexity of Matrix Power Fibonacci')
-plt.legend()
-plt.show()
-
-# Plot space complexity
-plt.figure(figsize=(10, 6))
-plt.loglog(first_series, space_used, 'go-', label='Actual space')
-ref_log_space = [space_used[0] * np.log2(x) / np.log2(first_series[0]) for x in first_series]
-plt.grid(True)
-plt.xlabel('n (log scale)')
-plt.ylabel('Memory Usage (KB, log scale)')
-plt.title('Space Complexity of Matrix Power Fibonacci')
-plt.legend()
-plt.show()
 
+def collect_results(series=first_series):
+    # Lists to store measurements
+    time_taken = []
+    space_used = []
+
+    # Compute Fibonacci numbers and measure performance
+    for num in series:
+        # Take multiple measurements for each n
+        times = []
+        peaks = []
+        for _ in range(5):  # Run 5 times for each number
+            tracemalloc.start()
+            start_time = time.time()
+            nth_fibonacci(num)
+            end_time = time.time()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            times.append(end_time - start_time)
+            peaks.append(peak)
+
+        # Use the minimum time and average memory to reduce impact of system variations
+        elapsed_time = min(times)
+        avg_memory = sum(peaks) / len(peaks) / 1024  # Convert to KB
+        time_taken.append(elapsed_time)
+        space_used.append(avg_memory)
+        print(f"Fibonacci({num}) computed in {elapsed_time:.6f} seconds, Peak Memory Usage: {avg_memory:.2f} KB")
+
+    return series, time_taken, space_used
+
+
+def plot_results(series, time_taken, space_used):
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    # Plot time complexity
+    plt.figure("matrix_power_time", figsize=(10, 6))
+    plt.loglog(series, time_taken, 'bo-', label='Actual time')
+    ref_log = [time_taken[0] * np.log2(x) / np.log2(series[0]) for x in series]
+    plt.grid(True)
+    plt.xlabel('n (log scale)')
+    plt.ylabel('Time (seconds, log scale)')
+    plt.title('Time Complexity of Matrix Power Fibonacci')
+    plt.legend()
+
+    # Plot space complexity
+    plt.figure("matrix_power_space", figsize=(10, 6))
+    plt.loglog(series, space_used, 'go-', label='Actual space')
+    ref_log_space = [space_used[0] * np.log2(x) / np.log2(series[0]) for x in series]
+    plt.grid(True)
+    plt.xlabel('n (log scale)')
+    plt.ylabel('Memory Usage (KB, log scale)')
+    plt.title('Space Complexity of Matrix Power Fibonacci')
+    plt.legend()
+
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    plot_results(*collect_results())
+    plt.show()
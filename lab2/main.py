@@ -1,6 +1,5 @@
 import random
 import time
-import matplotlib.pyplot as plt
 import copy
 import sys
 
@@ -88,12 +87,14 @@ def perform_analysis():
 
 
 def plot_results(results, sizes):
+    import matplotlib.pyplot as plt
+
     data_types = ["random", "sorted", "reversed", "partially_sorted", "duplicates"]
     algorithms = list(results.keys())
     colors = ['b', 'g', 'r', 'c', 'm']
 
     for i, alg in enumerate(algorithms):
-        plt.figure(figsize=(10, 6))
+        plt.figure(f"{alg.lower().replace(' ', '_')}_performance", figsize=(10, 6))
         sizes_to_use = sizes[0] if alg == "Quick Sort" else sizes[1]
         for data_type in data_types:
             plt.plot(sizes_to_use, results[alg][data_type], label=data_type, marker='o',
@@ -105,12 +106,14 @@ def plot_results(results, sizes):
         plt.legend()
         plt.grid(True)
         plt.tight_layout()
-        plt.show()
 
 
 if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
     results, sizes = perform_analysis()
     plot_results(results, sizes)
+    plt.show()
 
     print("\nEmpirical Analysis Conclusions:")
     print("1. Input Data Properties:")
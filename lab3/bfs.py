@@ -1,7 +1,5 @@
 import time
 import random
-import matplotlib.pyplot as plt
-import numpy as np
 from collections import deque
 
 
@@ -121,7 +119,9 @@ def measure_performance(graph_generator, max_size=800, step=50, repeats=50):
 
 # Plotting function
 def plot_results(results, title="BFS Performance on Different Graph Types"):
-    plt.figure(figsize=(12, 8))
+    import matplotlib.pyplot as plt
+
+    plt.figure("bfs_performance", figsize=(12, 8))
 
     for label, (sizes, times) in results.items():
         plt.plot(sizes, times, 'o-', label=label)
@@ -131,7 +131,6 @@ def plot_results(results, title="BFS Performance on Different Graph Types"):
     plt.title(title)
     plt.legend()
     plt.grid(True)
-    plt.show()
 
 
 # Main analysis
@@ -155,8 +154,12 @@ def analyze_bfs_performance():
         sizes, times = measure_performance(generator, max_size, step, repeats)
         results[name] = (sizes, times)
 
-    plot_results(results)
+    return results
 
 
-# Run the analysis
-analyze_bfs_performance()
\ No newline at end of file
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    # Run the analysis
+    plot_results(analyze_bfs_performance())
+    plt.show()
@@ -0,0 +1,146 @@
+import numpy as np
+
+TOP_DOWN = "top-down"
+BOTTOM_UP = "bottom-up"
+
+
+# One level of top-down BFS: every frontier vertex pushes to its unvisited neighbors
+def _top_down_step(graph, frontier, dist, parent, level):
+    sources, neighbors = graph.edges_from(frontier)
+    fresh = dist[neighbors] == -1
+    sources, neighbors = sources[fresh], neighbors[fresh]
+
+    # The frontier is sorted, so the first occurrence of each neighbor carries its
+    # lowest-numbered parent; np.unique also returns the next frontier sorted
+    next_frontier, first = np.unique(neighbors, return_index=True)
+    dist[next_frontier] = level
+    parent[next_frontier] = sources[first]
+    return next_frontier.astype(np.int64)
+
+
+# One level of bottom-up BFS: every unvisited vertex looks for any parent in the frontier.
+# The scan runs over in-edges, so it takes the reverse graph (the graph itself if undirected)
+def _bottom_up_step(reverse_graph, frontier, dist, parent, level):
+    in_frontier = np.zeros(reverse_graph.num_vertices, dtype=bool)
+    in_frontier[frontier] = True
+
+    # Check the j-th neighbor of all still-searching vertices at once and drop a
+    # vertex as soon as it finds a parent, so each vertex stops at its first hit
+    searching = np.flatnonzero(dist == -1)
+    found = []
+    j = 0
+    while searching.size:
+        edge = reverse_graph.offsets[searching] + j
+        has_edge = edge < reverse_graph.offsets[searching + 1]
+        searching, edge = searching[has_edge], edge[has_edge]
+        candidates = reverse_graph.targets[edge]
+        hit = in_frontier[candidates]
+        parent[searching[hit]] = candidates[hit]
+        found.append(searching[hit])
+        searching = searching[~hit]
+        j += 1
+
+    next_frontier = np.sort(np.concatenate(found)) if found else np.empty(0, dtype=np.int64)
+    dist[next_frontier] = level
+    return next_frontier
+
+
+def _as_sources(sources):
+    sources = np.unique(np.atleast_1d(np.asarray(sources, dtype=np.int64)))
+    if not sources.size:
+        raise ValueError("sources must be non-empty.")
+    return sources
+
+
+def direction_optimizing_bfs(graph, sources=0, alpha=14, beta=24, reverse_graph=None):
+    """
+    Direction-optimizing BFS (Beamer et al.) over a CSRGraph with sorted neighbor lists.
+    Switches to bottom-up when the frontier's edges exceed 1/alpha of the unvisited
+    vertices' edges, and back to top-down once a shrinking frontier drops below n/beta.
+    sources may be a single vertex or any collection of vertices, all at distance 0.
+    Bottom-up steps scan in-edges: for directed graphs pass reverse_graph (the
+    transposed CSRGraph, graph.transpose()); without it the graph must be undirected.
+    Returns (dist, parent, directions) with int32 dist/parent (-1 = unreached);
+    parent[v] is the lowest-numbered in-neighbor of v on the previous level, so the
+    result matches a plain level-by-level BFS.
+    """
+    n = graph.num_vertices
+    if reverse_graph is None:
+        reverse_graph = graph
+    degrees = graph.degrees()
+    # Unvisited vertices are checked through their in-edges
+    in_degrees = reverse_graph.degrees()
+    frontier = _as_sources(sources)
+
+    # Initially mark all the vertices as not visited
+    dist = np.full(n, -1, dtype=np.int32)
+    parent = np.full(n, -1, dtype=np.int32)
+    dist[frontier] = 0
+    parent[frontier] = frontier
+
+    edges_to_check = reverse_graph.num_edges - int(in_degrees[frontier].sum())
+    direction = TOP_DOWN
+    directions = []
+    level = 0
+
+    while frontier.size:
+        level += 1
+        frontier_edges = int(degrees[frontier].sum())
+        if direction == TOP_DOWN and frontier_edges > edges_to_check / alpha:
+            direction = BOTTOM_UP
+        directions.append(direction)
+
+        if direction == TOP_DOWN:
+            next_frontier = _top_down_step(graph, frontier, dist, parent, level)
+        else:
+            next_frontier = _bottom_up_step(reverse_graph, frontier, dist, parent, level)
+            # Go back to top-down once the frontier is small and shrinking
+            if next_frontier.size < frontier.size and next_frontier.size < n / beta:
+                direction = TOP_DOWN
+
+        edges_to_check -= int(in_degrees[next_frontier].sum())
+        frontier = next_frontier
+
+    # The last level found nothing new
+    directions.pop()
+    return dist, parent, directions
+
+
+def bfs(graph, sources=0, alpha=14, beta=24, reverse_graph=None):
+    """
+    Multi-source BFS returning (dist, parent) as int32 arrays, -1 for unreached vertices.
+    Directed graphs need reverse_graph, see direction_optimizing_bfs.
+    """
+    dist, parent, _ = direction_optimizing_bfs(graph, sources, alpha, beta, reverse_graph)
+    return dist, parent
+
+
+def connected_components(graph):
+    """
+    Label the connected components of an undirected CSRGraph in one O(V + E) sweep.
+    Returns (labels, count); components are numbered by their lowest vertex.
+    """
+    n = graph.num_vertices
+    degrees = graph.degrees()
+    labels = np.full(n, -1, dtype=np.int32)
+    # dist/parent are shared by all component searches: components never overlap
+    dist = np.full(n, -1, dtype=np.int32)
+    parent = np.full(n, -1, dtype=np.int32)
+    count = 0
+
+    for v in range(n):
+        if labels[v] != -1:
+            continue
+        labels[v] = count
+        if degrees[v]:
+            # Bottom-up steps would scan other components too, so stay top-down
+            dist[v] = 0
+            frontier = np.array([v], dtype=np.int64)
+            level = 0
+            while frontier.size:
+                level += 1
+                frontier = _top_down_step(graph, frontier, dist, parent, level)
+                labels[frontier] = count
+        count += 1
+
+    return labels, count
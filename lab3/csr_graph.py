@@ -0,0 +1,177 @@
+import numpy as np
+
+
+def index_dtype(n):
+    """Smallest signed integer dtype able to hold vertex ids 0..n-1"""
+    return np.int32 if n <= np.iinfo(np.int32).max else np.int64
+
+
+def sorted_unique(keys):
+    """Sort integer keys and drop repeats (sort + neighbor compare, cheaper than np.unique on big arrays)"""
+    keys = np.sort(keys)
+    if keys.size:
+        keep = np.empty(keys.size, dtype=bool)
+        keep[0] = True
+        np.not_equal(keys[1:], keys[:-1], out=keep[1:])
+        keys = keys[keep]
+    return keys
+
+
+# Compressed sparse row (CSR) graph representation
+class CSRGraph:
+    """
+    Graph stored as offsets/targets arrays: neighbors of v are targets[offsets[v]:offsets[v + 1]].
+    weights, when present, is parallel to targets.
+    """
+
+    def __init__(self, offsets, targets, weights=None):
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.num_vertices = len(offsets) - 1
+        self.num_edges = len(targets)
+
+    @classmethod
+    def from_adjacency_matrix(cls, adj):
+        """Build a CSR graph from a 0/1 adjacency matrix like the ones the lab3 generators return"""
+        matrix = np.asarray(adj)
+        n = len(matrix)
+        # np.nonzero walks the matrix row by row, so every row's targets come out sorted
+        rows, cols = np.nonzero(matrix == 1)
+        return cls.from_sorted_rows(n, rows, cols)
+
+    @classmethod
+    def from_sorted_rows(cls, n, rows, targets, weights=None):
+        """
+        Build a CSR graph from edges already grouped by source: rows[i] is the source
+        of targets[i] and rows is non-decreasing, so only the offsets are computed.
+        """
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=offsets[1:])
+        return cls(offsets, np.asarray(targets).astype(index_dtype(n), copy=False), weights)
+
+    @classmethod
+    def from_edges(cls, n, sources, targets, undirected=True, weights=None):
+        """
+        Build a CSR graph from edge arrays in O(E log E) without an n x n matrix.
+        Duplicate edges are dropped by sorting packed (u, v) keys; with weights,
+        the first occurrence of a duplicated edge keeps its weight.
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if undirected:
+            sources, targets = np.concatenate((sources, targets)), np.concatenate((targets, sources))
+            if weights is not None:
+                weights = np.concatenate((weights, weights))
+
+        # Sorting u * n + v orders edges by row and every row by target
+        keys = sources * n + targets
+        if weights is None:
+            keys = sorted_unique(keys)
+        else:
+            order = np.argsort(keys, kind="stable")
+            keys = keys[order]
+            first = np.ones(keys.size, dtype=bool)
+            np.not_equal(keys[1:], keys[:-1], out=first[1:])
+            keys, weights = keys[first], np.asarray(weights)[order][first]
+
+        rows = keys // n
+        return cls.from_sorted_rows(n, rows, keys - rows * n, weights)
+
+    @classmethod
+    def from_edge_chunks(cls, n, make_chunks, undirected=True, block_edges=1 << 20):
+        """
+        Build a CSR graph from a stream of (sources, targets) chunks without holding the
+        whole edge list twice. make_chunks() must return a fresh iterator each call
+        (e.g. a seeded generator): one pass counts degrees, a second one fills the rows,
+        then the rows are sorted block_edges edges at a time. Peak memory is the
+        offsets, the targets array and O(chunk + block_edges) scratch.
+        Edges are assumed to be unique, as the lab3 edge generators produce them.
+        """
+        def directed_chunks():
+            for sources, targets in make_chunks():
+                sources = np.asarray(sources, dtype=np.int64)
+                targets = np.asarray(targets, dtype=np.int64)
+                yield sources, targets
+                if undirected:
+                    yield targets, sources
+
+        # First pass: degrees
+        degrees = np.zeros(n, dtype=np.int64)
+        for sources, _ in directed_chunks():
+            degrees += np.bincount(sources, minlength=n)
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(degrees, out=offsets[1:])
+
+        # Second pass: write each edge at its row's cursor
+        cursor = offsets[:-1].copy()
+        all_targets = np.empty(offsets[-1], dtype=index_dtype(n))
+        for sources, targets in directed_chunks():
+            order = np.argsort(sources, kind="stable")
+            sources, targets = sources[order], targets[order]
+            # Rank of each edge among the chunk's edges with the same source
+            group_start = np.searchsorted(sources, sources, side="left")
+            rank = np.arange(len(sources)) - group_start
+            all_targets[cursor[sources] + rank] = targets
+            cursor += np.bincount(sources, minlength=n)
+
+        # Sort every row by target, as np.nonzero-built graphs are
+        graph = cls(offsets, all_targets)
+        graph.sort_rows(block_edges)
+        return graph
+
+    def degrees(self):
+        """Out-degree of every vertex"""
+        return np.diff(self.offsets)
+
+    def edge_sources(self):
+        """Source vertex of every edge, parallel to targets"""
+        return np.repeat(np.arange(self.num_vertices, dtype=index_dtype(self.num_vertices)), self.degrees())
+
+    def sort_rows(self, block_edges=1 << 20):
+        """Sort every row by target in place (weights follow), a block of about block_edges edges at a time"""
+        offsets = np.asarray(self.offsets)
+        n = self.num_vertices
+        row = 0
+        while row < n:
+            # Take whole rows until the block holds about block_edges edges
+            stop = max(int(np.searchsorted(offsets, offsets[row] + block_edges, side="right")) - 1, row + 1)
+            stop = min(stop, n)
+            lo, hi = offsets[row], offsets[stop]
+            if hi > lo:
+                rows = np.repeat(np.arange(row, stop, dtype=np.int64), np.diff(offsets[row:stop + 1]))
+                order = np.lexsort((np.asarray(self.targets[lo:hi]), rows))
+                self.targets[lo:hi] = np.asarray(self.targets[lo:hi])[order]
+                if self.weights is not None:
+                    self.weights[lo:hi] = np.asarray(self.weights[lo:hi])[order]
+            row = stop
+
+    def neighbors(self, v):
+        """Targets of the edges leaving v"""
+        return self.targets[self.offsets[v]:self.offsets[v + 1]]
+
+    def edges_from(self, vertices):
+        """Return (sources, targets) of every edge leaving the given vertices, in vertex order"""
+        vertices = np.asarray(vertices, dtype=np.int64)
+        starts = self.offsets[vertices]
+        counts = self.offsets[vertices + 1] - starts
+        total = int(counts.sum())
+        sources = np.repeat(vertices, counts)
+        # Position of each edge = start of its row + its rank inside the row
+        row_begin = np.repeat(np.cumsum(counts) - counts, counts)
+        positions = np.arange(total, dtype=np.int64) - row_begin + np.repeat(starts, counts)
+        return sources, self.targets[positions]
+
+    def transpose(self):
+        """Graph with every edge reversed (weights follow their edges), rows sorted by target"""
+        # A stable sort by target keeps each new row ordered by its (ascending) sources
+        order = np.argsort(self.targets, kind="stable")
+        weights = None if self.weights is None else self.weights[order]
+        return CSRGraph.from_sorted_rows(self.num_vertices, self.targets[order], self.edge_sources()[order], weights)
+
+
+def with_unit_weights(graph):
+    """The graph itself if it has weights, else a copy sharing its arrays with every edge weighing 1"""
+    if graph.weights is not None:
+        return graph
+    return CSRGraph(graph.offsets, graph.targets, np.ones(graph.num_edges))
@@ -1,7 +1,5 @@
 import time
 import random
-import matplotlib.pyplot as plt
-import numpy as np
 from collections import deque
 
 
@@ -102,7 +100,9 @@ def measure_performance(graph_generator, max_size=800, step=50, repeats=50):
 
 # Plotting function
 def plot_results(results, title="DFS Performance on Different Graph Types"):
-    plt.figure(figsize=(12, 8))
+    import matplotlib.pyplot as plt
+
+    plt.figure("dfs_performance", figsize=(12, 8))
 
     for label, (sizes, times) in results.items():
         plt.plot(sizes, times, 'o-', label=label)
@@ -112,7 +112,6 @@ def plot_results(results, title="DFS Performance on Different Graph Types"):
     plt.title(title)
     plt.legend()
     plt.grid(True)
-    plt.show()
 
 
 # Main analysis
@@ -136,8 +135,12 @@ def analyze_dfs_performance():
         sizes, times = measure_performance(generator, max_size, step, repeats)
         results[name] = (sizes, times)
 
-    plot_results(results)
+    return results
 
 
-# Run the analysis
-analyze_dfs_performance()
\ No newline at end of file
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    # Run the analysis
+    plot_results(analyze_dfs_performance())
+    plt.show()
@@ -0,0 +1,148 @@
+import numpy as np
+
+
+# Iterative DFS analytics over CSR graphs. Everything is driven by one
+# discovery-time/low-link pass with an explicit stack, so there is no recursion
+# limit and a 10^6-vertex chain is handled like any other graph.
+
+def dfs_lowlink(graph, directed=True):
+    """
+    Run one iterative DFS over all vertices and compute discovery times and low-links.
+    directed=True uses Tarjan's rule (low only through vertices still on the SCC
+    stack) and labels strongly connected components on the way; directed=False
+    ignores the edge back to the DFS parent and collects bridges and articulation
+    points. Returns a dict with the arrays each analysis needs.
+    The CSR arrays are read edge by edge with .item(), never copied, so a memmapped
+    graph file stays on disk; the per-vertex state is O(V) Python lists.
+    """
+    n = graph.num_vertices
+    offsets, targets = graph.offsets, graph.targets
+
+    disc = [-1] * n
+    low = [0] * n
+    parent = [-1] * n
+    # Edge cursor and row end of every discovered vertex
+    next_edge = [0] * n
+    end_edge = [0] * n
+    postorder = []
+    self_loop = False
+    clock = 0
+
+    # Tarjan state (directed)
+    component = [-1] * n
+    on_stack = [False] * n
+    scc_stack = []
+    components = 0
+
+    # Bridge / articulation state (undirected)
+    skipped_parent = [False] * n
+    children = [0] * n
+    bridges = []
+    is_cut = [False] * n
+
+    for root in range(n):
+        if disc[root] != -1:
+            continue
+        disc[root] = low[root] = clock
+        clock += 1
+        parent[root] = root
+        next_edge[root], end_edge[root] = offsets.item(root), offsets.item(root + 1)
+        if directed:
+            scc_stack.append(root)
+            on_stack[root] = True
+        stack = [root]
+
+        while stack:
+            u = stack[-1]
+            i = next_edge[u]
+            if i < end_edge[u]:
+                next_edge[u] = i + 1
+                v = targets.item(i)
+                if disc[v] == -1:
+                    # Tree edge: descend
+                    disc[v] = low[v] = clock
+                    clock += 1
+                    parent[v] = u
+                    next_edge[v], end_edge[v] = offsets.item(v), offsets.item(v + 1)
+                    children[u] += 1
+                    if directed:
+                        scc_stack.append(v)
+                        on_stack[v] = True
+                    stack.append(v)
+                elif directed:
+                    if v == u:
+                        self_loop = True
+                    if on_stack[v] and disc[v] < low[u]:
+                        low[u] = disc[v]
+                elif v == parent[u] and not skipped_parent[u]:
+                    # Skip the tree edge we came in on (only once, so parallel edges still count)
+                    skipped_parent[u] = True
+                elif disc[v] < low[u]:
+                    low[u] = disc[v]
+                continue
+
+            # All edges of u are done: retreat
+            stack.pop()
+            postorder.append(u)
+            p = parent[u]
+            if p != u and low[u] < low[p]:
+                low[p] = low[u]
+
+            if directed:
+                if low[u] == disc[u]:
+                    # u is the root of a strongly connected component
+                    while True:
+                        w = scc_stack.pop()
+                        on_stack[w] = False
+                        component[w] = components
+                        if w == u:
+                            break
+                    components += 1
+            elif p != u:
+                if low[u] > disc[p]:
+                    bridges.append((p, u))
+                if parent[p] != p and low[u] >= disc[p]:
+                    is_cut[p] = True
+
+        if not directed and children[root] > 1:
+            is_cut[root] = True
+
+    result = {
+        "disc": np.array(disc, dtype=np.int32),
+        "low": np.array(low, dtype=np.int32),
+        "parent": np.array(parent, dtype=np.int32),
+        "postorder": np.array(postorder, dtype=np.int32),
+    }
+    if directed:
+        result["component"] = np.array(component, dtype=np.int32)
+        result["components"] = components
+        result["self_loop"] = self_loop
+    else:
+        result["bridges"] = np.array(bridges, dtype=np.int32).reshape(-1, 2)
+        result["articulation_points"] = np.flatnonzero(is_cut).astype(np.int32)
+    return result
+
+
+def strongly_connected_components(graph):
+    """Tarjan SCC: returns (labels, count); labels come out in reverse topological order"""
+    result = dfs_lowlink(graph, directed=True)
+    return result["component"], result["components"]
+
+
+def bridges(graph):
+    """Bridges of an undirected graph as an (k, 2) array of (parent, child) DFS tree edges"""
+    return dfs_lowlink(graph, directed=False)["bridges"]
+
+
+def articulation_points(graph):
+    """Articulation points (cut vertices) of an undirected graph, sorted"""
+    return dfs_lowlink(graph, directed=False)["articulation_points"]
+
+
+def topological_sort(graph):
+    """Topological order of a directed graph; raises ValueError if the graph has a cycle"""
+    result = dfs_lowlink(graph, directed=True)
+    # A directed graph is acyclic iff every SCC is a single vertex without a self-loop
+    if result["components"] < graph.num_vertices or result["self_loop"]:
+        raise ValueError("Graph has a cycle. Topological order does not exist.")
+    return result["postorder"][::-1].copy()
@@ -0,0 +1,129 @@
+import numpy as np
+
+from csr_graph import CSRGraph, index_dtype, sorted_unique
+
+
+# Edge-list graph generators: the same graph families as bfs.py/dfs.py, but
+# produced as (sources, targets) arrays in O(E) time and memory instead of an
+# n x n adjacency matrix. Every random generator takes a seed for reproducibility.
+
+def chain_edges(n):
+    """Chain graph 0-1-2-...-n-1"""
+    dtype = index_dtype(n)
+    u = np.arange(max(n - 1, 0), dtype=dtype)
+    return u, u + 1
+
+
+def tree_edges(n):
+    """Balanced binary tree: vertex i hangs below (i - 1) // 2"""
+    dtype = index_dtype(n)
+    v = np.arange(1, max(n, 1), dtype=dtype)
+    return (v - 1) // 2, v
+
+
+def cyclic_edges(n):
+    """Single cycle 0-1-2-...-n-1-0"""
+    u, v = chain_edges(n)
+    if n < 3:
+        return u, v
+    # Complete the cycle
+    return np.append(u, 0).astype(u.dtype), np.append(v, n - 1).astype(v.dtype)
+
+
+def _unique_pairs(n, u, v):
+    """Drop self-loops and duplicates from undirected pairs by sorting packed (min, max) keys"""
+    u = np.asarray(u, dtype=np.int64)
+    v = np.asarray(v, dtype=np.int64)
+    keep = u != v
+    lo = np.minimum(u[keep], v[keep])
+    hi = np.maximum(u[keep], v[keep])
+    return sorted_unique(lo * n + hi)
+
+
+def _keys_to_edges(n, keys):
+    dtype = index_dtype(n)
+    u = keys // n
+    return u.astype(dtype), (keys - u * n).astype(dtype)
+
+
+def _triangle_pairs(n, index):
+    """Map linear indices of the strict upper triangle (row-major) to (i, j) pairs"""
+    rows = np.arange(n, dtype=np.int64)
+    # Row i of the strict upper triangle starts at linear index i * (2n - i - 1) / 2
+    row_start = rows * (2 * n - rows - 1) // 2
+    i = np.searchsorted(row_start, index, side="right") - 1
+    j = index - row_start[i] + i + 1
+    dtype = index_dtype(n)
+    return i.astype(dtype), j.astype(dtype)
+
+
+def random_sparse_edges(n, edge_factor=2, seed=None):
+    """Random graph with exactly min(edge_factor * n, n(n-1)/2) distinct edges"""
+    rng = np.random.default_rng(seed)
+    max_edges = n * (n - 1) // 2
+    target_edges = min(edge_factor * n, max_edges)
+
+    if 2 * target_edges > max_edges:
+        # Nearly complete: sampling pairs would keep hitting duplicates, so pick
+        # positions in the upper triangle directly
+        index = np.sort(rng.choice(max_edges, size=target_edges, replace=False))
+        return _triangle_pairs(n, index)
+
+    # Draw random pairs in bulk until enough distinct ones survive deduplication
+    keys = np.empty(0, dtype=np.int64)
+    while len(keys) < target_edges:
+        missing = target_edges - len(keys)
+        draws = int(missing * 1.1) + 16
+        u = rng.integers(0, n, size=draws)
+        v = rng.integers(0, n, size=draws)
+        keys = sorted_unique(np.concatenate((keys, _unique_pairs(n, u, v))))
+
+    # Keep a uniform subset of the right size (the keys are already sorted)
+    if len(keys) > target_edges:
+        keys = keys[np.sort(rng.choice(len(keys), size=target_edges, replace=False))]
+    return _keys_to_edges(n, keys)
+
+
+def iter_random_dense_edges(n, density=0.5, seed=None, chunk_size=1 << 20):
+    """
+    Stream the edges of G(n, p = density) in chunks of about chunk_size edges.
+    Gaps between chosen upper-triangle positions are geometric, so the cost is
+    O(E) and no n x n matrix or per-pair random number is ever needed.
+    """
+    if density <= 0 or n < 2:
+        return
+    rng = np.random.default_rng(seed)
+    max_edges = n * (n - 1) // 2
+    position = -1
+    while True:
+        index = position + np.cumsum(rng.geometric(min(density, 1.0), size=chunk_size))
+        index = index[index < max_edges]
+        if index.size:
+            yield _triangle_pairs(n, index)
+            position = index[-1]
+        if index.size < chunk_size:
+            return
+
+
+def random_dense_edges(n, density=0.5, seed=None):
+    """All edges of G(n, p = density) as one pair of arrays"""
+    chunks = list(iter_random_dense_edges(n, density, seed))
+    dtype = index_dtype(n)
+    if not chunks:
+        return np.empty(0, dtype=dtype), np.empty(0, dtype=dtype)
+    return np.concatenate([u for u, _ in chunks]), np.concatenate([v for _, v in chunks])
+
+
+def generate_csr_graph(edge_generator, n, *args, **kwargs):
+    """Run an edge generator and assemble its output straight into an undirected CSRGraph"""
+    u, v = edge_generator(n, *args, **kwargs)
+    return CSRGraph.from_edges(n, u, v)
+
+
+def generate_dense_csr_graph(n, density=0.5, seed=None, chunk_size=1 << 20):
+    """Assemble G(n, p) into CSR chunk by chunk, never holding the full edge list"""
+    if seed is None:
+        # Both CSR passes must see the same edges
+        seed = np.random.SeedSequence().entropy
+    return CSRGraph.from_edge_chunks(
+        n, lambda: iter_random_dense_edges(n, density, seed, chunk_size))
@@ -0,0 +1,219 @@
+import os
+import struct
+
+import numpy as np
+
+from csr_graph import CSRGraph, index_dtype
+
+
+# Binary CSR graph file, opened with np.memmap so graphs of any size load
+# without parsing or copying. Layout (little-endian):
+#
+#   header (64 bytes): magic, version, flags, vertex count, edge count,
+#                      target dtype, weight dtype
+#   offsets  int64[num_vertices + 1]
+#   targets  int32/int64[num_edges]
+#   weights  weight dtype[num_edges]          (only with FLAG_WEIGHTED)
+#
+# Every array starts on a 64-byte boundary. num_edges counts stored entries, so
+# an undirected graph stores each edge in both directions.
+
+MAGIC = b"AAGRAPH\0"
+VERSION = 1
+FLAG_WEIGHTED = 1
+FLAG_UNDIRECTED = 2
+
+_HEADER = struct.Struct("<8sIIQQ8s8s")
+HEADER_SIZE = 64
+_ALIGN = 64
+
+
+def _aligned(position):
+    return (position + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _layout(header):
+    """Byte offsets of the offsets/targets/weights arrays described by a header"""
+    n, m = header["num_vertices"], header["num_edges"]
+    offsets_at = HEADER_SIZE
+    targets_at = _aligned(offsets_at + 8 * (n + 1))
+    weights_at = _aligned(targets_at + header["index_dtype"].itemsize * m)
+    return offsets_at, targets_at, weights_at
+
+
+def _write_header(f, n, m, flags, targets_dtype, weights_dtype):
+    packed = _HEADER.pack(MAGIC, VERSION, flags, n, m,
+                          targets_dtype.str.encode(), weights_dtype.str.encode())
+    f.write(packed.ljust(HEADER_SIZE, b"\0"))
+
+
+def read_header(path):
+    """Read and validate the header of a graph file"""
+    with open(path, "rb") as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"{path} is too short to be a graph file")
+    magic, version, flags, n, m, targets_dtype, weights_dtype = _HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a graph file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported graph file version {version}")
+    return {
+        "flags": flags,
+        "weighted": bool(flags & FLAG_WEIGHTED),
+        "undirected": bool(flags & FLAG_UNDIRECTED),
+        "num_vertices": n,
+        "num_edges": m,
+        "index_dtype": np.dtype(targets_dtype.rstrip(b"\0").decode()),
+        "weight_dtype": np.dtype(weights_dtype.rstrip(b"\0").decode()),
+    }
+
+
+def _pad_to(f, position):
+    f.write(b"\0" * (position - f.tell()))
+
+
+def save_graph(path, graph, undirected=True):
+    """Write a CSRGraph to path in the binary graph format"""
+    n, m = graph.num_vertices, graph.num_edges
+    targets = np.asarray(graph.targets, dtype=np.dtype(index_dtype(n)).newbyteorder("<"))
+    weighted = graph.weights is not None
+    weights_dtype = np.asarray(graph.weights).dtype.newbyteorder("<") if weighted else np.dtype("<f8")
+    flags = (FLAG_WEIGHTED if weighted else 0) | (FLAG_UNDIRECTED if undirected else 0)
+
+    header = {"num_vertices": n, "num_edges": m, "index_dtype": targets.dtype}
+    offsets_at, targets_at, weights_at = _layout(header)
+    with open(path, "wb") as f:
+        _write_header(f, n, m, flags, targets.dtype, weights_dtype)
+        np.asarray(graph.offsets, dtype="<i8").tofile(f)
+        _pad_to(f, targets_at)
+        targets.tofile(f)
+        if weighted:
+            _pad_to(f, weights_at)
+            np.asarray(graph.weights, dtype=weights_dtype).tofile(f)
+
+
+def _map(path, dtype, mode, offset, count):
+    # np.memmap refuses zero-length maps
+    if count == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=(count,))
+
+
+def open_graph(path, mode="r"):
+    """
+    Memory-map a graph file as a CSRGraph. Nothing is read up front: the arrays are
+    np.memmap views, so the OS pages in only what an algorithm touches.
+    Use mode="r+" to modify weights in place.
+    """
+    header = read_header(path)
+    n, m = header["num_vertices"], header["num_edges"]
+    offsets_at, targets_at, weights_at = _layout(header)
+
+    offsets = _map(path, "<i8", mode, offsets_at, n + 1)
+    targets = _map(path, header["index_dtype"], mode, targets_at, m)
+    weights = None
+    if header["weighted"]:
+        weights = _map(path, header["weight_dtype"], mode, weights_at, m)
+    return CSRGraph(offsets, targets, weights)
+
+
+def _parse_edge_lines(lines, comments):
+    """Parse whitespace-separated 'u v [w]' lines into a 2-D float array"""
+    lines = [line for line in lines if line.strip() and not line.lstrip().startswith(comments)]
+    if not lines:
+        return np.empty((0, 2))
+    return np.loadtxt(lines, comments=comments, ndmin=2)
+
+
+def import_edge_list(text_path, out_path, num_vertices=None, undirected=True,
+                     weight_dtype=np.float64, comments="#", chunk_lines=1 << 20):
+    """
+    Convert a 'u v' or 'u v w' text edge list into a graph file in one streaming pass.
+    Parsed edges are spooled to a temporary binary file while degrees are counted,
+    then scattered into the memory-mapped output and every row is sorted by target.
+    Duplicate edges are kept as they appear.
+    """
+    spool_path = out_path + ".edges.tmp"
+    degrees = np.zeros(num_vertices or 0, dtype=np.int64)
+    weighted = None
+    spooled = 0
+
+    try:
+        # Single pass over the text: parse, spool, count degrees
+        with open(text_path) as text, open(spool_path, "wb") as spool:
+            while True:
+                lines = text.readlines(chunk_lines * 16)
+                if not lines:
+                    break
+                rows = _parse_edge_lines(lines, comments)
+                if rows.size == 0:
+                    continue
+                if weighted is None:
+                    weighted = rows.shape[1] >= 3
+                sources = rows[:, 0].astype(np.int64)
+                targets = rows[:, 1].astype(np.int64)
+                weights = rows[:, 2] if weighted else np.zeros(len(rows))
+                if undirected:
+                    sources, targets = np.concatenate((sources, targets)), np.concatenate((targets, sources))
+                    weights = np.concatenate((weights, weights))
+
+                top = int(max(sources.max(), targets.max())) + 1
+                if top > len(degrees):
+                    if num_vertices is not None:
+                        raise ValueError(f"Vertex {top - 1} is out of range for {num_vertices} vertices")
+                    degrees = np.concatenate((degrees, np.zeros(top - len(degrees), dtype=np.int64)))
+                degrees += np.bincount(sources, minlength=len(degrees))
+
+                # Spool rows of (u, v, float64 weight bits)
+                np.stack((sources, targets, weights.view(np.int64)), axis=1).tofile(spool)
+                spooled += len(sources)
+
+        n = len(degrees)
+        m = spooled
+        weighted = bool(weighted)
+        targets_dtype = np.dtype(index_dtype(n)).newbyteorder("<")
+        weights_dtype = np.dtype(weight_dtype).newbyteorder("<")
+        flags = (FLAG_WEIGHTED if weighted else 0) | (FLAG_UNDIRECTED if undirected else 0)
+
+        # Lay out the output file and map it
+        with open(out_path, "wb") as f:
+            _write_header(f, n, m, flags, targets_dtype, weights_dtype)
+        graph_offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(degrees, out=graph_offsets[1:])
+        header = {"num_vertices": n, "num_edges": m, "index_dtype": targets_dtype}
+        offsets_at, targets_at, weights_at = _layout(header)
+        end = weights_at + weights_dtype.itemsize * m if weighted else targets_at + targets_dtype.itemsize * m
+        with open(out_path, "r+b") as f:
+            f.truncate(end)
+            f.seek(offsets_at)
+            graph_offsets.astype("<i8").tofile(f)
+
+        graph = open_graph(out_path, mode="r+")
+
+        # Scatter the spooled edges into their rows (binary reads, no re-parsing)
+        cursor = graph_offsets[:-1].copy()
+        if m:
+            spool = np.memmap(spool_path, dtype=np.int64, mode="r", shape=(m, 3))
+            for start in range(0, m, chunk_lines):
+                block = np.asarray(spool[start:start + chunk_lines])
+                sources = block[:, 0]
+                order = np.argsort(sources, kind="stable")
+                sources = sources[order]
+                rank = np.arange(len(sources)) - np.searchsorted(sources, sources, side="left")
+                slots = cursor[sources] + rank
+                graph.targets[slots] = block[order, 1]
+                if weighted:
+                    graph.weights[slots] = block[order, 2].view(np.float64)
+                cursor += np.bincount(sources, minlength=n)
+            del spool
+
+        graph.sort_rows(chunk_lines)
+        for array in (graph.targets, graph.weights):
+            if isinstance(array, np.memmap):
+                array.flush()
+    finally:
+        if os.path.exists(spool_path):
+            os.remove(spool_path)
+
+    return open_graph(out_path)
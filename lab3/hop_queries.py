@@ -0,0 +1,82 @@
+import numpy as np
+
+from search_scratch import SearchScratch
+
+
+# Point-to-point hop-distance queries with bidirectional BFS
+class HopQueryEngine:
+    """
+    Answers "how many hops from s to t" without exploring the whole component.
+    Searches grow from both ends, always expanding the frontier with fewer edges,
+    and stop on the level where they meet. Scratch arrays are allocated once and
+    reused across queries (see SearchScratch).
+    For directed graphs pass reverse_graph (the transposed CSRGraph).
+    """
+
+    def __init__(self, graph, reverse_graph=None):
+        self.graphs = (graph, reverse_graph if reverse_graph is not None else graph)
+        self.degrees = (self.graphs[0].degrees(), self.graphs[1].degrees())
+        n = graph.num_vertices
+        # Row 0 belongs to the forward search from s, row 1 to the backward search from t
+        self._scratch = SearchScratch(n, np.int32)
+
+    def query(self, s, t):
+        """Return (hops, path, explored); hops is -1 and path empty when t is unreachable"""
+        scratch = self._scratch
+        generation = scratch.next_generation()
+        stamp, dist, parent = scratch.stamp, scratch.dist, scratch.parent
+        if s == t:
+            return 0, [s], 1
+
+        for side, root in ((0, s), (1, t)):
+            scratch.start(side, root)
+        frontiers = [np.array([s], dtype=np.int64), np.array([t], dtype=np.int64)]
+        explored = 2
+
+        while frontiers[0].size and frontiers[1].size:
+            # Expand the cheaper side
+            work = [int(self.degrees[side][frontiers[side]].sum()) for side in (0, 1)]
+            side = 0 if work[0] <= work[1] else 1
+            other = 1 - side
+
+            sources, neighbors = self.graphs[side].edges_from(frontiers[side])
+            fresh = stamp[side, neighbors] != generation
+            sources, neighbors = sources[fresh], neighbors[fresh]
+            reached, first = np.unique(neighbors, return_index=True)
+            level = dist[side, frontiers[side][0]] + 1
+            stamp[side, reached] = generation
+            dist[side, reached] = level
+            parent[side, reached] = sources[first]
+            explored += reached.size
+
+            # The frontiers met: the best meeting vertex is the one closest to the other root
+            met = reached[stamp[other, reached] == generation]
+            if met.size:
+                v = int(met[np.argmin(dist[other, met])])
+                hops = int(level + dist[other, v])
+                forward = scratch.walk(0, v)[::-1]
+                backward = scratch.walk(1, v)[1:]
+                return hops, forward + backward, explored
+
+            frontiers[side] = reached
+
+        return -1, [], explored
+
+    def query_batch(self, pairs):
+        """
+        Run many (s, t) queries on the same scratch arrays.
+        Returns (hops, paths, explored) with int32/int64 arrays and a list of paths.
+        """
+        hops = np.empty(len(pairs), dtype=np.int32)
+        explored = np.empty(len(pairs), dtype=np.int64)
+        paths = []
+        for i, (s, t) in enumerate(pairs):
+            hops[i], path, explored[i] = self.query(int(s), int(t))
+            paths.append(path)
+        return hops, paths, explored
+
+
+def hop_distance(graph, s, t):
+    """One-off bidirectional BFS query returning (hops, path)"""
+    hops, path, _ = HopQueryEngine(graph).query(s, t)
+    return hops, path
@@ -0,0 +1,189 @@
+import numpy as np
+
+
+# BFS/DFS over implicit graphs: neighbors come from a function instead of an
+# adjacency matrix, so grids and rule-defined neighborhoods never have to be
+# materialized. Visited state is one of
+#   "bitset"   - one bit per vertex, needs num_vertices (10^8 cells = 12.5 MB)
+#   "set"      - a hash set of visited vertices, for unbounded vertex spaces
+#   "frontier" - undirected graphs only: remember just the previous and current
+#                levels, since a BFS edge never skips a level. Memory then
+#                scales with the frontier, not with the vertices visited.
+
+class BitSet:
+    """Fixed-size set of integers 0..size-1 packed one bit per element"""
+
+    def __init__(self, size):
+        self.size = size
+        self.bits = bytearray((size + 7) // 8)
+        self._array = np.frombuffer(self.bits, dtype=np.uint8)
+
+    def __contains__(self, i):
+        return self.bits[i >> 3] >> (i & 7) & 1 == 1
+
+    def add(self, i):
+        self.bits[i >> 3] |= 1 << (i & 7)
+
+    def add_new(self, indices):
+        """Vectorized test-and-set: add indices and return the ones that were not present yet"""
+        indices = np.unique(np.asarray(indices, dtype=np.int64))
+        byte = indices >> 3
+        mask = (1 << (indices & 7)).astype(np.uint8)
+        new = indices[(self._array[byte] & mask) == 0]
+        np.bitwise_or.at(self._array, new >> 3, (1 << (new & 7)).astype(np.uint8))
+        return new
+
+
+def _default_visited(num_vertices, visited):
+    if visited is not None:
+        return visited
+    return "bitset" if num_vertices is not None else "set"
+
+
+def implicit_bfs(sources, neighbors, num_vertices=None, visited=None):
+    """
+    BFS driven by a neighbor callback: neighbors(v) returns an iterable of vertices.
+    Vertices may be any hashable value with visited="set" or "frontier"; "bitset"
+    needs integer vertices below num_vertices. Yields (level, frontier) pairs, so
+    callers can stream the search without keeping all levels around.
+    """
+    mode = _default_visited(num_vertices, visited)
+    frontier = list(dict.fromkeys(sources))
+
+    if mode == "bitset":
+        seen = BitSet(num_vertices)
+        for v in frontier:
+            seen.add(v)
+    elif mode == "set":
+        seen = set(frontier)
+    elif mode == "frontier":
+        previous, current = set(), set(frontier)
+    else:
+        raise ValueError(f"Unknown visited mode: {mode}")
+
+    level = 0
+    while frontier:
+        yield level, frontier
+        level += 1
+        next_frontier = []
+        for u in frontier:
+            for v in neighbors(u):
+                if mode == "frontier":
+                    if v in previous or v in current:
+                        continue
+                    current.add(v)
+                elif v in seen:
+                    continue
+                else:
+                    seen.add(v)
+                next_frontier.append(v)
+        if mode == "frontier":
+            # current now also holds the next level; keep only the last two levels
+            previous, current = set(frontier), set(next_frontier)
+        frontier = next_frontier
+
+
+def implicit_bfs_batched(sources, neighbor_fn, num_vertices=None, visited=None):
+    """
+    Vectorized BFS: neighbor_fn(vertices) takes an int64 array and returns the
+    flat array of all their neighbors. Yields (level, frontier) with each frontier
+    a sorted int64 array.
+    """
+    mode = _default_visited(num_vertices, visited)
+    frontier = np.unique(np.asarray(sources, dtype=np.int64))
+
+    if mode == "bitset":
+        seen = BitSet(num_vertices)
+        seen.add_new(frontier)
+    elif mode == "set":
+        seen = set(frontier.tolist())
+    elif mode == "frontier":
+        previous = np.empty(0, dtype=np.int64)
+    else:
+        raise ValueError(f"Unknown visited mode: {mode}")
+
+    level = 0
+    while frontier.size:
+        yield level, frontier
+        level += 1
+        candidates = np.asarray(neighbor_fn(frontier), dtype=np.int64)
+        if mode == "bitset":
+            next_frontier = seen.add_new(candidates)
+        elif mode == "set":
+            candidates = np.unique(candidates)
+            fresh = [v for v in candidates.tolist() if v not in seen]
+            seen.update(fresh)
+            next_frontier = np.array(fresh, dtype=np.int64)
+        else:
+            candidates = np.unique(candidates)
+            old = np.isin(candidates, previous, assume_unique=True) | \
+                np.isin(candidates, frontier, assume_unique=True)
+            previous, next_frontier = frontier, candidates[~old]
+        frontier = next_frontier
+
+
+def implicit_dfs(source, neighbors, num_vertices=None, visited=None):
+    """Iterative DFS preorder from source over a neighbor callback (generator)"""
+    mode = _default_visited(num_vertices, visited)
+    if mode == "bitset":
+        seen = BitSet(num_vertices)
+    elif mode == "set":
+        seen = set()
+    else:
+        raise ValueError("DFS needs a full visited set: use 'bitset' or 'set'")
+
+    seen.add(source)
+    yield source
+    stack = [iter(neighbors(source))]
+    while stack:
+        for v in stack[-1]:
+            if v not in seen:
+                seen.add(v)
+                yield v
+                stack.append(iter(neighbors(v)))
+                break
+        else:
+            stack.pop()
+
+
+# Grid graphs: cell (row, col) of a height x width grid is vertex row * width + col
+def grid_neighbors(width, height, passable=None):
+    """
+    Vectorized 4-neighborhood of a grid for implicit_bfs_batched.
+    passable, if given, maps an array of cell ids to a boolean mask of open cells.
+    """
+    def neighbor_fn(cells):
+        row, col = np.divmod(cells, width)
+        parts = [cells[row > 0] - width, cells[row < height - 1] + width,
+                 cells[col > 0] - 1, cells[col < width - 1] + 1]
+        result = np.concatenate(parts)
+        if passable is not None:
+            result = result[passable(result)]
+        return result
+    return neighbor_fn
+
+
+def grid_neighbor_callback(width, height, passable=None):
+    """Per-cell 4-neighborhood of a grid for implicit_bfs / implicit_dfs"""
+    def neighbors(cell):
+        row, col = divmod(cell, width)
+        if row > 0:
+            yield cell - width
+        if row < height - 1:
+            yield cell + width
+        if col > 0:
+            yield cell - 1
+        if col < width - 1:
+            yield cell + 1
+
+    if passable is None:
+        return neighbors
+    return lambda cell: (v for v in neighbors(cell) if passable(v))
+
+
+def grid_bfs_level_sizes(width, height, source=0, passable=None, visited="frontier"):
+    """Number of cells at every BFS distance from source, using frontier-sized memory"""
+    return [len(frontier) for _, frontier in
+            implicit_bfs_batched([source], grid_neighbors(width, height, passable),
+                                 num_vertices=width * height, visited=visited)]
+
@@ -0,0 +1,105 @@
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+from csr_graph import CSRGraph
+from bfs_engine import _as_sources, _top_down_step
+from shared_arrays import SharedArrays, attach_worker, worker_state
+
+
+# Level-synchronous BFS over a process pool. The graph, the dist array and the
+# current frontier live in shared memory; each worker expands one slice of the
+# frontier into a local frontier and the parent process merges them. Parents
+# follow the bfs_engine convention (lowest-numbered vertex on the previous
+# level), so results are identical to the sequential bfs(); the pool only runs
+# top-down steps, so directed graphs need no reverse graph here.
+
+def _setup_worker(state):
+    """View the attached offsets/targets as the worker's CSRGraph"""
+    state["graph"] = CSRGraph(state["offsets"], state["targets"])
+
+
+def _expand_slice(bounds):
+    """Expand frontier[start:stop] and return its new vertices with their lowest parent"""
+    start, stop = bounds
+    dist = worker_state["dist"]
+    sources, neighbors = worker_state["graph"].edges_from(worker_state["frontier"][start:stop])
+    fresh = dist[neighbors] == -1
+    local, first = np.unique(neighbors[fresh], return_index=True)
+    return local, sources[fresh][first]
+
+
+class ParallelBFS:
+    """
+    Reusable parallel BFS engine: the graph is copied to shared memory once and the
+    pool stays up across queries. Use as a context manager or call close().
+    Levels whose frontier has fewer than min_parallel_edges edges run in-process,
+    where a pool round-trip would cost more than it saves.
+    """
+
+    def __init__(self, graph, workers=None, min_parallel_edges=1 << 16):
+        self.graph = graph
+        self.workers = workers or os.cpu_count()
+        self.min_parallel_edges = min_parallel_edges
+        self.degrees = graph.degrees()
+
+        n = graph.num_vertices
+        self._arrays = SharedArrays((("offsets", graph.offsets), ("targets", graph.targets),
+                                     ("dist", np.full(n, -1, dtype=np.int32)),
+                                     ("frontier", np.zeros(n, dtype=np.int64))))
+        self._pool = Pool(self.workers, initializer=attach_worker, initargs=(self._arrays.specs, _setup_worker))
+
+    def _split(self, frontier):
+        """Cut the frontier into one slice per worker with about equal edge counts"""
+        work = np.cumsum(self.degrees[frontier])
+        cuts = np.searchsorted(work, work[-1] * np.arange(1, self.workers) / self.workers)
+        bounds = np.concatenate(([0], cuts, [len(frontier)]))
+        return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+    def run(self, sources=0):
+        """BFS from one or more sources; returns int32 (dist, parent) like bfs_engine.bfs"""
+        n = self.graph.num_vertices
+        dist = self._arrays.views["dist"]
+        dist[:] = -1
+        parent = np.full(n, -1, dtype=np.int32)
+
+        frontier = _as_sources(sources)
+        dist[frontier] = 0
+        parent[frontier] = frontier
+        level = 0
+
+        while frontier.size:
+            level += 1
+            if int(self.degrees[frontier].sum()) < self.min_parallel_edges:
+                frontier = _top_down_step(self.graph, frontier, dist, parent, level)
+                continue
+
+            self._arrays.views["frontier"][:frontier.size] = frontier
+            results = self._pool.map(_expand_slice, self._split(frontier))
+
+            # Slices are in frontier order, so the first copy of a vertex has its lowest parent
+            candidates = np.concatenate([local for local, _ in results])
+            parents = np.concatenate([found for _, found in results])
+            frontier, first = np.unique(candidates, return_index=True)
+            dist[frontier] = level
+            parent[frontier] = parents[first]
+
+        return dist.copy(), parent
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+        self._arrays.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def parallel_bfs(graph, sources=0, workers=None, min_parallel_edges=1 << 16):
+    """One-shot parallel BFS returning int32 (dist, parent)"""
+    with ParallelBFS(graph, workers, min_parallel_edges) as engine:
+        return engine.run(sources)
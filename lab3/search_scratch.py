@@ -0,0 +1,41 @@
+import numpy as np
+
+
+# Reusable scratch for repeated searches on one graph
+class SearchScratch:
+    """
+    dist/parent arrays with one row per search side (e.g. forward from s and
+    backward from t), allocated once. Every entry is tagged with the generation
+    stamp of the query that wrote it, and entries with an older stamp count as
+    unset, so starting a query clears nothing.
+    """
+
+    def __init__(self, n, dist_dtype, sides=2):
+        self.stamp = np.zeros((sides, n), dtype=np.uint32)
+        self.dist = np.zeros((sides, n), dtype=dist_dtype)
+        self.parent = np.zeros((sides, n), dtype=np.int32)
+        self.generation = 0
+
+    def next_generation(self):
+        """Start a new query and return its stamp"""
+        if self.generation == np.iinfo(np.uint32).max:
+            # Stamps wrapped around: this is the only time the scratch arrays are cleared
+            self.stamp[:] = 0
+            self.generation = 0
+        self.generation += 1
+        return self.generation
+
+    def start(self, side, root):
+        """Make root the distance-0 root of one side in the current query"""
+        self.stamp[side, root] = self.generation
+        self.dist[side, root] = 0
+        self.parent[side, root] = root
+
+    def walk(self, side, v):
+        """Follow one side's parents from v back to that side's root"""
+        parent = self.parent[side]
+        path = [v]
+        while parent[v] != v:
+            v = int(parent[v])
+            path.append(v)
+        return path
@@ -0,0 +1,78 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+# NumPy arrays in multiprocessing shared memory, for the process-pool engines.
+# The parent copies its arrays in once (SharedArrays) and starts its Pool with
+# initializer=attach_worker, initargs=(specs,); every worker maps them into
+# worker_state, so no array is ever pickled. A spec is (block name, shape, dtype).
+
+# Worker-side arrays by name, filled once per pool process by attach_worker
+worker_state = {}
+
+def share_array(array):
+    """Copy an array into a new shared memory block and return (block, view)"""
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[...] = array
+    return block, view
+
+
+def attach_array(spec):
+    """Map an existing block from its spec and return (block, view); keep block alive while view is used"""
+    block_name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=block_name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def attach_arrays(specs, into):
+    """Worker side: map every spec into the dict into, as into[name] (and its block as into[name + "_block"])"""
+    for name, spec in specs.items():
+        block, view = attach_array(spec)
+        into[name] = view
+        into[name + "_block"] = block
+
+
+def attach_worker(specs, setup=None):
+    """Pool initializer: attach specs into worker_state, then call setup(worker_state) if given"""
+    attach_arrays(specs, worker_state)
+    if setup is not None:
+        setup(worker_state)
+
+
+class SharedArrays:
+    """
+    Named arrays copied into shared memory by the parent process. views[name] is
+    the parent's view of each array and specs is what workers attach. Use as a
+    context manager or call close(), which unlinks the blocks; drop any other
+    reference to the views first.
+    """
+
+    def __init__(self, arrays):
+        self.views = {}
+        self.specs = {}
+        self._blocks = []
+        try:
+            for name, array in arrays:
+                block, view = share_array(array)
+                self._blocks.append(block)
+                self.views[name] = view
+                self.specs[name] = (block.name, view.shape, view.dtype)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        self.views.clear()
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
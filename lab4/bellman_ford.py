@@ -0,0 +1,135 @@
+from collections import deque
+
+import numpy as np
+from math import inf
+
+from dijkstra import as_csr
+
+
+class NegativeCycleError(ValueError):
+    """Raised when shortest paths do not exist; cycle lists the vertices of one negative cycle"""
+
+    def __init__(self, cycle):
+        super().__init__(f"Graph has a negative cycle {cycle}. Shortest paths do not exist.")
+        self.cycle = cycle
+
+
+def _start(n, source):
+    """Initial (dist, pred). source=None starts every vertex at 0, as a virtual source joined to all would"""
+    dist = np.full(n, inf)
+    pred = np.full(n, -1, dtype=np.int32)
+    roots = np.arange(n) if source is None else np.array([source])
+    dist[roots] = 0
+    pred[roots] = roots
+    return dist, pred
+
+
+def _pred_cycle(pred, start):
+    """Follow pred from start; return the cycle it runs into as a list in edge order, or None"""
+    order = {}
+    v = start
+    while v not in order:
+        order[v] = len(order)
+        parent = int(pred[v])
+        if parent == -1 or parent == v:
+            return None
+        v = parent
+    # v is the first repeated vertex: the walk from v back to v is the cycle (reversed)
+    cycle = [v]
+    u = int(pred[v])
+    while u != v:
+        cycle.append(u)
+        u = int(pred[u])
+    cycle.reverse()
+    return cycle
+
+
+def _find_cycle(pred, candidates):
+    for v in candidates:
+        cycle = _pred_cycle(pred, int(v))
+        if cycle is not None:
+            return cycle
+    return None
+
+
+# --------------------------
+# Bellman-Ford (vectorized rounds)
+# --------------------------
+def bellman_ford(graph, source=None):
+    """
+    Single-source shortest paths for any real weights, as (dist, pred) like
+    dijkstra_sssp. Each round relaxes every edge at once with np.minimum.at;
+    the loop stops after the first round that changes nothing (at most n - 1
+    useful rounds). source=None measures from a virtual source joined to every
+    vertex by a 0-weight edge (Johnson's potentials), so any negative cycle counts.
+    Raises NegativeCycleError when a negative cycle is reachable.
+    """
+    graph = as_csr(graph)
+    n = graph.num_vertices
+    sources = graph.edge_sources()
+    targets, weights = graph.targets, graph.weights
+    dist, pred = _start(n, source)
+
+    for _ in range(n):
+        candidate = dist[sources] + weights
+        better = candidate < dist[targets]
+        if not better.any():
+            return dist, pred
+        v, candidate, u = targets[better], candidate[better], sources[better]
+        np.minimum.at(dist, v, candidate)
+        won = candidate == dist[v]
+        pred[v[won]] = u[won]
+
+    # Still improving after n rounds: the predecessor graph now contains a negative cycle
+    cycle = _find_cycle(pred, np.unique(v))
+    if cycle is None:
+        cycle = _find_cycle(pred, range(n))
+    if cycle is None:
+        # A negative self-loop makes its vertex its own predecessor, like a root
+        loops = (sources == targets) & (weights < 0) & np.isfinite(dist[sources])
+        cycle = [int(sources[loops][0])]
+    raise NegativeCycleError(cycle)
+
+
+# --------------------------
+# SPFA (queue-based Bellman-Ford)
+# --------------------------
+def spfa(graph, source=None):
+    """
+    Bellman-Ford that only rescans vertices whose distance changed, which on sparse
+    graphs usually touches far fewer edges than full rounds. Same arguments, result
+    and NegativeCycleError as bellman_ford.
+    """
+    graph = as_csr(graph)
+    n = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist, pred = _start(n, source)
+
+    queue = deque(range(n) if source is None else [source])
+    queued = np.zeros(n, dtype=bool)
+    queued[list(queue)] = True
+    # Edges on the path behind dist[v]; a shortest path never needs n of them
+    hops = np.zeros(n, dtype=np.int64)
+    while queue:
+        u = queue.popleft()
+        queued[u] = False
+        lo, hi = offsets[u], offsets[u + 1]
+        v = targets[lo:hi]
+        candidate = dist[u] + weights[lo:hi]
+        better = candidate < dist[v]
+        if not better.any():
+            continue
+        v, candidate = v[better], candidate[better]
+        np.minimum.at(dist, v, candidate)
+        pred[v[candidate == dist[v]]] = u
+        hops[v] = hops[u] + 1
+        if hops[u] + 1 >= n:
+            cycle = _find_cycle(pred, [u])
+            if cycle is None:
+                # Not on u's predecessor walk yet: finish with full rounds, which always find it
+                return bellman_ford(graph, source)
+            raise NegativeCycleError(cycle)
+        for vertex in v[~queued[v]].tolist():
+            queued[vertex] = True
+            queue.append(vertex)
+    return dist, pred
@@ -0,0 +1,95 @@
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+import lab_paths  # noqa: F401  (makes lab3's shared_arrays importable)
+from shared_arrays import SharedArrays, attach_worker, worker_state
+from floyd_warshall_numpy import infinity_of, to_distance_array
+
+
+# Tiled Floyd-Warshall. The matrix is cut into tile x tile blocks and every round
+# kb runs the three dependent phases of the blocked algorithm:
+#   1. the diagonal tile (kb, kb) against itself
+#   2. the tiles in block row kb and block column kb against the diagonal tile
+#   3. every remaining tile (i, j) against tiles (i, kb) and (kb, j)
+# Tiles within a phase are independent, so phases 2 and 3 are spread over a process
+# pool; the distance matrix lives in shared memory and workers update it in place.
+# Each tile stays in cache for all of its tile k-steps instead of the whole n x n
+# matrix being streamed from memory once per k.
+
+def _relax_tile(dist, tile, ib, jb, kb):
+    """D[ib, jb] = min(D[ib, jb], D[ib, kb] (min,+) D[kb, jb]) for one tile, in place"""
+    rows = slice(ib * tile, min((ib + 1) * tile, len(dist)))
+    cols = slice(jb * tile, min((jb + 1) * tile, len(dist)))
+    via = slice(kb * tile, min((kb + 1) * tile, len(dist)))
+    target = dist[rows, cols]
+    left = dist[rows, via]
+    right = dist[via, cols]
+    scratch = np.empty(target.shape, dtype=dist.dtype)
+    # In phases 1 and 2 target overlaps left or right; that is the usual in-place
+    # Floyd-Warshall update and stays correct because row/column k do not change at step k
+    for k in range(left.shape[1]):
+        np.add(left[:, k, None], right[k], out=scratch)
+        np.minimum(target, scratch, out=target)
+
+
+def _relax_tiles(task):
+    """Worker body: relax a list of (ib, jb) tiles through block kb of the shared matrix"""
+    tile, kb, tiles = task
+    dist = worker_state["dist"]
+    for ib, jb in tiles:
+        _relax_tile(dist, tile, ib, jb, kb)
+
+
+def _round_tasks(num_blocks, kb):
+    """Phase 2 and phase 3 tile lists of round kb"""
+    others = [b for b in range(num_blocks) if b != kb]
+    phase2 = [(kb, b) for b in others] + [(b, kb) for b in others]
+    phase3 = [[(ib, jb) for jb in others] for ib in others]  # one block row per task
+    return phase2, phase3
+
+
+# --------------------------
+# Blocked Floyd-Warshall
+# --------------------------
+def blocked_floyd_warshall(graph, dtype=np.float64, tile=256, workers=None):
+    """
+    All-pairs shortest paths from an inf-filled weight matrix as an n x n array of
+    dtype (see floyd_warshall_numpy for the integer infinity sentinel).
+    tile is the block edge length: 128-512 keeps a float64 tile triple in L2 cache.
+    workers defaults to os.cpu_count(); with one worker everything runs in-process.
+    """
+    dist = to_distance_array(graph, dtype)
+    n = len(dist)
+    tile = max(1, min(tile, n))
+    num_blocks = -(-n // tile)
+    workers = workers or os.cpu_count()
+
+    if workers == 1 or num_blocks == 1:
+        for kb in range(num_blocks):
+            _relax_tile(dist, tile, kb, kb, kb)
+            phase2, phase3 = _round_tasks(num_blocks, kb)
+            for ib, jb in phase2:
+                _relax_tile(dist, tile, ib, jb, kb)
+            for row in phase3:
+                for ib, jb in row:
+                    _relax_tile(dist, tile, ib, jb, kb)
+    else:
+        with SharedArrays([("dist", dist)]) as shared:
+            shared_dist = shared.views["dist"]
+            with Pool(workers, initializer=attach_worker, initargs=(shared.specs,)) as pool:
+                for kb in range(num_blocks):
+                    _relax_tile(shared_dist, tile, kb, kb, kb)
+                    phase2, phase3 = _round_tasks(num_blocks, kb)
+                    # Split phase 2 into one chunk per worker, it has only 2 * (blocks - 1) tiles
+                    chunks = [phase2[w::workers] for w in range(workers)]
+                    pool.map(_relax_tiles, [(tile, kb, chunk) for chunk in chunks if chunk])
+                    pool.map(_relax_tiles, [(tile, kb, row) for row in phase3])
+            dist = shared_dist.copy()
+            del shared_dist
+
+    if not np.issubdtype(dist.dtype, np.floating):
+        infinity = infinity_of(dist.dtype)
+        dist[dist > infinity // 2] = infinity
+    return dist
@@ -0,0 +1,346 @@
+import time
+import heapq
+
+import numpy as np
+from math import inf
+
+import lab_paths  # noqa: F401  (makes lab3's csr_graph importable)
+from csr_graph import CSRGraph, index_dtype
+from dijkstra import as_csr
+from priority_queues import HeapQueue
+
+
+# --------------------------
+# Upward CSR with shortcut middles
+# --------------------------
+def _upward_csr(n, sources, targets, weights, middles):
+    """CSRGraph of the given edges (lightest of parallel edges kept) plus the parallel middle array"""
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+    middles = np.asarray(middles, dtype=index_dtype(n))
+    order = np.lexsort((weights, targets, sources))
+    sources, targets, weights, middles = sources[order], targets[order], weights[order], middles[order]
+    first = np.ones(sources.size, dtype=bool)
+    first[1:] = (sources[1:] != sources[:-1]) | (targets[1:] != targets[:-1])
+    sources, targets, weights, middles = sources[first], targets[first], weights[first], middles[first]
+    return CSRGraph.from_sorted_rows(n, sources, targets, weights), middles
+
+
+# --------------------------
+# Contraction hierarchy
+# --------------------------
+class ContractionHierarchy:
+    """
+    Preprocessed shortest-path structure for repeated queries on a static graph
+    with non-negative weights.
+    Preprocessing contracts vertices in order of importance, edge difference
+    (shortcuts added - edges removed) plus the number of already contracted
+    neighbours, re-evaluated lazily when a vertex reaches the front of the queue.
+    A shortcut u -> x through v is added only if a bounded witness search from u
+    finds no path to x avoiding v that is at most as short.
+    The result is two CSR graphs: up (edges towards higher rank) and down
+    (edges from higher rank, stored reversed), each with the middle vertex of every
+    shortcut (-1 for original edges). A query is a bidirectional Dijkstra that only
+    climbs: forward over up from s, backward over down from t.
+    preprocessing_time (seconds) and num_shortcuts are recorded.
+    """
+
+    def __init__(self, graph, witness_settle_limit=64):
+        graph = as_csr(graph)
+        n = graph.num_vertices
+        self.num_vertices = n
+        self.witness_settle_limit = witness_settle_limit
+        start = time.time()
+
+        # Working copy as dicts: out_edges[u][v] = weight, in_edges[v][u] = weight
+        self._out = [dict() for _ in range(n)]
+        self._in = [dict() for _ in range(n)]
+        self._middle = {}
+        sources = graph.edge_sources()
+        for u, v, w in zip(sources.tolist(), graph.targets.tolist(), graph.weights.tolist()):
+            if u != v and w < self._out[u].get(v, inf):
+                self._out[u][v] = w
+                self._in[v][u] = w
+
+        self.rank = np.full(n, -1, dtype=np.int64)
+        self.num_shortcuts = 0
+        up_edges, down_edges = [], []
+        deleted_neighbors = np.zeros(n, dtype=np.int64)
+
+        queue = HeapQueue(n)
+        for v in range(n):
+            queue.push(v, self._priority(v, deleted_neighbors))
+        order = 0
+        while queue:
+            key, v = queue.pop()
+            # Lazy update: contract only if the priority has not grown since it was queued
+            priority = self._priority(v, deleted_neighbors)
+            if queue and priority > key:
+                queue.push(v, priority)
+                continue
+
+            # Remaining neighbours all get a higher rank: record v's edges to them
+            for x, w in self._out[v].items():
+                up_edges.append((v, x, w, self._middle.get((v, x), -1)))
+            for u, w in self._in[v].items():
+                down_edges.append((v, u, w, self._middle.get((u, v), -1)))
+            shortcuts = self._shortcuts(v)
+            self._remove(v)
+            for u, x, w in shortcuts:
+                if w < self._out[u].get(x, inf):
+                    self._out[u][x] = w
+                    self._in[x][u] = w
+                    self._middle[(u, x)] = v
+                    self.num_shortcuts += 1
+            for u in set(self._out[v]) | set(self._in[v]):
+                deleted_neighbors[u] += 1
+            self.rank[v] = order
+            order += 1
+        del self._out, self._in, self._middle
+
+        def build(edges):
+            if not edges:
+                return _upward_csr(n, [], [], [], [])
+            return _upward_csr(n, *zip(*edges))
+
+        self.up, self.up_middle = build(up_edges)
+        self.down, self.down_middle = build(down_edges)
+        self.preprocessing_time = time.time() - start
+
+        # Queries run in pure Python, so each side keeps its rows as lists:
+        # side 0 searches up from s, side 1 searches down-reversed from t
+        self._rows = tuple(self._row_lists(graph) for graph in (self.up, self.down))
+        # Middle vertex of every shortcut, keyed by its original direction (a, b), for unpacking
+        self._shortcut_middles = {}
+        for graph, middles, upward in ((self.up, self.up_middle, True), (self.down, self.down_middle, False)):
+            shortcut = middles != -1
+            rows, targets = graph.edge_sources()[shortcut].tolist(), graph.targets[shortcut].tolist()
+            pairs = zip(rows, targets) if upward else zip(targets, rows)
+            self._shortcut_middles.update(zip(pairs, middles[shortcut].tolist()))
+        # Stamped scratch like lab3's SearchScratch, but in lists: the scalar query loop reads them faster
+        self._stamp = ([0] * n, [0] * n)
+        self._dist = ([0.0] * n, [0.0] * n)
+        self._pred = ([0] * n, [0] * n)
+        self._generation = 0
+        self._queues = (HeapQueue(n), HeapQueue(n))
+
+    @staticmethod
+    def _row_lists(graph):
+        targets, weights, offsets = graph.targets.tolist(), graph.weights.tolist(), graph.offsets.tolist()
+        return [list(zip(targets[lo:hi], weights[lo:hi])) for lo, hi in zip(offsets[:-1], offsets[1:])]
+
+    # --------------------------
+    # Preprocessing helpers
+    # --------------------------
+    def _witness_distances(self, source, skip, limit):
+        """
+        Dijkstra from source in the remaining graph without vertex skip, stopping past
+        distance limit or after witness_settle_limit settled vertices. Uses heapq on a
+        dict: the searches are tiny, and an n-sized queue per search would cost more.
+        """
+        dist = {source: 0}
+        heap = [(0, source)]
+        settled = 0
+        while heap and settled < self.witness_settle_limit:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            if d > limit:
+                break
+            settled += 1
+            for x, w in self._out[u].items():
+                if x != skip and d + w < dist.get(x, inf):
+                    dist[x] = d + w
+                    heapq.heappush(heap, (d + w, x))
+        return dist
+
+    def _shortcuts(self, v):
+        """Shortcuts (u, x, weight) needed to keep all distances when v is removed"""
+        shortcuts = []
+        out_edges = self._out[v]
+        if not out_edges:
+            return shortcuts
+        max_out = max(out_edges.values())
+        for u, w_uv in self._in[v].items():
+            witness = self._witness_distances(u, v, w_uv + max_out)
+            for x, w_vx in out_edges.items():
+                if x != u and witness.get(x, inf) > w_uv + w_vx:
+                    shortcuts.append((u, x, w_uv + w_vx))
+        return shortcuts
+
+    def _priority(self, v, deleted_neighbors):
+        removed = len(self._out[v]) + len(self._in[v])
+        return len(self._shortcuts(v)) - removed + int(deleted_neighbors[v])
+
+    def _remove(self, v):
+        for x in self._out[v]:
+            del self._in[x][v]
+        for u in self._in[v]:
+            del self._out[u][v]
+
+    # --------------------------
+    # Queries
+    # --------------------------
+    def _unpack(self, a, b):
+        """Original vertices of edge a -> b after a, expanding shortcuts iteratively"""
+        middles = self._shortcut_middles
+        path = []
+        stack = [(a, b)]
+        while stack:
+            a, b = stack.pop()
+            middle = middles.get((a, b), -1)
+            if middle == -1:
+                path.append(b)
+            else:
+                stack.append((middle, b))
+                stack.append((a, middle))
+        return path
+
+    def query(self, s, t):
+        """Return (distance, path, settled); distance is inf and path empty when t is unreachable"""
+        self._generation += 1
+        generation = self._generation
+        for side, root in ((0, s), (1, t)):
+            self._stamp[side][root] = generation
+            self._dist[side][root] = 0.0
+            self._pred[side][root] = root
+            self._queues[side].push(root, 0.0)
+        mu, meet = inf, -1
+        settled = 0
+
+        while self._queues[0] or self._queues[1]:
+            for side in (0, 1):
+                queue = self._queues[side]
+                if not queue:
+                    continue
+                key, u = queue.pop()
+                if key >= mu:
+                    # Everything this side could still reach is at least as long as mu
+                    while queue:
+                        queue.pop()
+                    continue
+                other = 1 - side
+                stamp, dist, pred = self._stamp[side], self._dist[side], self._pred[side]
+                if self._stamp[other][u] == generation and key + self._dist[other][u] < mu:
+                    mu, meet = key + self._dist[other][u], u
+
+                # Stall-on-demand: a higher vertex already reaches u more cheaply, so u's
+                # key is not its upward distance and its edges need not be relaxed
+                stalled = False
+                for x, w in self._rows[other][u]:
+                    if stamp[x] == generation and dist[x] + w < key:
+                        stalled = True
+                        break
+                if stalled:
+                    continue
+                settled += 1
+
+                for x, w in self._rows[side][u]:
+                    candidate = key + w
+                    if stamp[x] != generation or candidate < dist[x]:
+                        stamp[x] = generation
+                        dist[x] = candidate
+                        pred[x] = u
+                        queue.push(x, candidate)
+
+        if meet == -1:
+            return inf, [], settled
+        # Upward halves s -> meet and meet <- t, then expand every shortcut
+        halves = []
+        for side in (0, 1):
+            pred = self._pred[side]
+            half = [meet]
+            while pred[half[-1]] != half[-1]:
+                half.append(pred[half[-1]])
+            halves.append(half)
+        hops = halves[0][::-1] + halves[1][1:]
+        path = [s]
+        for a, b in zip(hops, hops[1:]):
+            path.extend(self._unpack(a, b))
+        return float(mu), path, settled
+
+    def query_batch(self, pairs):
+        """Run many (s, t) queries; returns (distances, paths, settled) like PointToPointEngine"""
+        distances = np.empty(len(pairs))
+        settled = np.empty(len(pairs), dtype=np.int64)
+        paths = []
+        for i, (s, t) in enumerate(pairs):
+            distances[i], path, settled[i] = self.query(int(s), int(t))
+            paths.append(path)
+        return distances, paths, settled
+
+
+# --------------------------
+# Empirical Analysis
+# --------------------------
+def grid_graph(side, max_weight=9, seed=None):
+    """Undirected side x side grid with random integer weights 1..max_weight"""
+    rng = np.random.default_rng(seed)
+    index = np.arange(side * side).reshape(side, side)
+    sources = np.concatenate((index[:, :-1].ravel(), index[:-1, :].ravel()))
+    targets = np.concatenate((index[:, 1:].ravel(), index[1:, :].ravel()))
+    weights = rng.integers(1, max_weight + 1, sources.size).astype(np.float64)
+    return CSRGraph.from_edges(side * side, sources, targets, weights=weights)
+
+
+def collect_results(sides=(25, 50, 100, 316), num_queries=200, seed=0):
+    """
+    Build a hierarchy on side x side grids (up to ~10^5 vertices) and time num_queries
+    random s -> t queries against bidirectional Dijkstra on the same pairs
+    (distances are checked to agree). The 316 x 316 grid alone takes minutes.
+    Returns {side: {"preprocessing": s, "shortcuts": count, "ch": ms per query,
+    "bidirectional": ms per query, "settled": mean vertices settled per CH query}}.
+    """
+    from point_to_point import PointToPointEngine
+
+    rng = np.random.default_rng(seed)
+    results = {}
+    for side in sides:
+        print(f"Testing {side}x{side} grid...")
+        graph = grid_graph(side, seed=seed)
+        pairs = rng.integers(0, side * side, (num_queries, 2))
+        hierarchy = ContractionHierarchy(graph)
+
+        start_time = time.time()
+        distances, _, settled = hierarchy.query_batch(pairs)
+        ch_time = time.time() - start_time
+
+        engine = PointToPointEngine(graph, num_landmarks=0)
+        start_time = time.time()
+        expected, _, _ = engine.query_batch(pairs)
+        bidirectional_time = time.time() - start_time
+        assert np.array_equal(distances, expected), "contraction hierarchy and bidirectional Dijkstra disagree"
+
+        results[side] = {"preprocessing": hierarchy.preprocessing_time, "shortcuts": hierarchy.num_shortcuts,
+                         "ch": 1000 * ch_time / num_queries,
+                         "bidirectional": 1000 * bidirectional_time / num_queries,
+                         "settled": float(settled.mean())}
+    return results
+
+
+def plot_results(results):
+    import matplotlib.pyplot as plt
+
+    plt.figure("contraction_hierarchy_queries", figsize=(8, 6))
+    vertices = [side * side for side in results]
+    plt.plot(vertices, [row["ch"] for row in results.values()], 'o-', label='Contraction hierarchy')
+    plt.plot(vertices, [row["bidirectional"] for row in results.values()], 's-', label='Bidirectional Dijkstra')
+    plt.xlabel('Number of Nodes (grid)')
+    plt.ylabel('Time per query (ms)')
+    plt.title('Point-to-Point Query Time')
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+
+
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
+
+    results = collect_results()
+    for side, row in results.items():
+        print(f"{side}x{side}: preprocessing {row['preprocessing']:.1f} s, {row['shortcuts']} shortcuts, "
+              f"{row['ch']:.2f} ms per query ({row['settled']:.0f} settled), "
+              f"bidirectional Dijkstra {row['bidirectional']:.2f} ms")
+    plot_results(results)
+    plt.show()
@@ -0,0 +1,194 @@
+import os
+
+import numpy as np
+from math import inf
+
+import lab_paths  # noqa: F401  (makes lab3's csr_graph importable)
+from csr_graph import CSRGraph, with_unit_weights
+
+
+def csr_to_matrix(graph):
+    """Inf-filled float64 weight matrix of a CSRGraph (parallel edges keep the lightest, missing weights count as 1)"""
+    graph = with_unit_weights(graph)
+    n = graph.num_vertices
+    matrix = np.full((n, n), inf)
+    np.minimum.at(matrix, (graph.edge_sources(), graph.targets), graph.weights)
+    return matrix
+
+
+def default_no_edge(dtype):
+    """Default "no edge" sentinel: inf for floats, the largest value for integers"""
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.floating):
+        return dtype.type(inf)
+    return dtype.type(np.iinfo(dtype).max)
+
+
+def no_edge_path(path):
+    """Sidecar .npy file next to a saved graph that holds its no-edge sentinel"""
+    return os.path.splitext(os.fspath(path))[0] + ".no_edge.npy"
+
+
+# Dense weight matrix stored in one NumPy array (optionally memmapped)
+class DenseGraph:
+    """
+    n x n weight matrix in a compact dtype such as uint8, uint16 or float32, with
+    no_edge marking missing edges. A 20k-vertex uint8 graph takes 400 MB instead of
+    the ~3.2 GB of pointers a list of lists needs. Algorithms read it through row
+    blocks converted to float64 with inf for no edge, never cell by cell.
+    """
+
+    def __init__(self, weights, no_edge=None):
+        self.weights = weights
+        self.no_edge = default_no_edge(weights.dtype) if no_edge is None else weights.dtype.type(no_edge)
+        self.num_vertices = len(weights)
+
+    def __len__(self):
+        return self.num_vertices
+
+    @classmethod
+    def from_matrix(cls, graph, dtype=np.float32, no_edge=None):
+        """Convert an inf-filled weight matrix (list of lists or array) to a DenseGraph"""
+        matrix = np.asarray(graph, dtype=np.float64)
+        no_edge = default_no_edge(dtype) if no_edge is None else np.dtype(dtype).type(no_edge)
+        present = np.isfinite(matrix)
+        values = matrix[present]
+        if not np.issubdtype(np.dtype(dtype), np.floating) and values.size:
+            info = np.iinfo(dtype)
+            if (values != np.round(values)).any() or values.min() < info.min or values.max() > info.max:
+                raise ValueError(f"Edge weights do not fit {np.dtype(dtype).name}.")
+        if (values == no_edge).any():
+            raise ValueError(f"Edge weight {no_edge} collides with the no-edge sentinel.")
+        weights = np.full(matrix.shape, no_edge, dtype=dtype)
+        weights[present] = values
+        return cls(weights, no_edge)
+
+    @classmethod
+    def from_csr(cls, graph, dtype=np.float64, no_edge=None):
+        """Dense copy of a weighted CSRGraph (the lightest of parallel edges is kept)"""
+        return cls.from_matrix(csr_to_matrix(graph), dtype, no_edge)
+
+    @classmethod
+    def create(cls, path, n, dtype=np.uint8, no_edge=None):
+        """New .npy-backed graph with no edges, memmapped read-write from path"""
+        weights = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(n, n))
+        graph = cls(weights, no_edge)
+        weights[:] = graph.no_edge
+        graph._save_no_edge(path)
+        return graph
+
+    @classmethod
+    def open(cls, path, no_edge=None, mode="r"):
+        """
+        Memmap a graph written by save() or create(); only touched rows are read.
+        no_edge defaults to the sentinel stored next to the file, or to
+        default_no_edge for a plain .npy matrix saved without one.
+        """
+        if no_edge is None and os.path.exists(no_edge_path(path)):
+            no_edge = np.load(no_edge_path(path))[()]
+        return cls(np.load(path, mmap_mode=mode), no_edge)
+
+    def save(self, path):
+        """Write the matrix to path (.npy) and the no-edge sentinel to its sidecar file"""
+        np.save(path, self.weights)
+        self._save_no_edge(path)
+
+    def _save_no_edge(self, path):
+        np.save(no_edge_path(path), np.array(self.no_edge, dtype=self.weights.dtype))
+
+    def block_rows(self):
+        """Rows per block so that a float64 copy of the block stays around 8 MB"""
+        return max(1, (8 << 20) // max(8 * self.num_vertices, 1))
+
+    def rows(self, start, stop):
+        """Rows start..stop-1 as float64 with inf for no edge"""
+        block = np.asarray(self.weights[start:stop])
+        rows = block.astype(np.float64)
+        rows[block == self.no_edge] = inf
+        return rows
+
+    def row(self, u):
+        return self.rows(u, u + 1)[0]
+
+    def is_symmetric(self):
+        n = self.num_vertices
+        step = self.block_rows()
+        for start in range(0, n, step):
+            stop = min(start + step, n)
+            if not np.array_equal(self.weights[start:stop], self.weights[:, start:stop].T):
+                return False
+        return True
+
+    def count_edges(self):
+        """Number of edges except self-loops, counted a block of rows at a time"""
+        n = self.num_vertices
+        step = self.block_rows()
+        count = 0
+        for start in range(0, n, step):
+            stop = min(start + step, n)
+            block = np.asarray(self.weights[start:stop])
+            count += int(np.count_nonzero(block != self.no_edge))
+            diagonal = block[np.arange(stop - start), np.arange(start, stop)]
+            count -= int(np.count_nonzero(diagonal != self.no_edge))
+        return count
+
+    def edge_arrays(self, upper=False):
+        """
+        (sources, targets, float64 weights) of every edge in row order. Self-loops
+        are left out unless negative (a negative cycle); with upper=True only u < v
+        is kept, i.e. each undirected edge once.
+        """
+        n = self.num_vertices
+        step = self.block_rows()
+        parts = []
+        for start in range(0, n, step):
+            stop = min(start + step, n)
+            block = np.asarray(self.weights[start:stop])
+            present = block != self.no_edge
+            rows, cols = np.nonzero(present)
+            rows += start
+            values = block[rows - start, cols].astype(np.float64)
+            keep = cols > rows if upper else (cols != rows) | (values < 0)
+            parts.append((rows[keep], cols[keep], values[keep]))
+        if not parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+        return tuple(np.concatenate(arrays) for arrays in zip(*parts))
+
+    def to_csr(self):
+        """Weighted CSRGraph of the edges (non-negative self-loops dropped)"""
+        return CSRGraph.from_sorted_rows(self.num_vertices, *self.edge_arrays())
+
+
+def as_dense_graph(graph):
+    """Wrap an inf-filled weight matrix as a float64 DenseGraph (no copy for float64 arrays)"""
+    if isinstance(graph, DenseGraph):
+        return graph
+    return DenseGraph(np.asarray(graph, dtype=np.float64))
+
+
+# --------------------------
+# Graph Generation
+# --------------------------
+def random_dense_graph(n, density=0.2, max_weight=10, dtype=np.uint8, seed=None, path=None):
+    """
+    Undirected graph with each pair joined with probability density and integer
+    weights 1..max_weight, generated row block by row block. With path given the
+    matrix is a .npy memmap on disk, so n can exceed what fits in RAM.
+    """
+    rng = np.random.default_rng(seed)
+    if path is None:
+        graph = DenseGraph(np.full((n, n), default_no_edge(dtype), dtype=dtype))
+    else:
+        graph = DenseGraph.create(path, n, dtype)
+    weights = graph.weights
+    step = max(1, (8 << 20) // max(8 * n, 1))
+    for start in range(0, n, step):
+        stop = min(start + step, n)
+        rows, cols = np.nonzero(rng.random((stop - start, n)) < density)
+        rows += start
+        upper = cols > rows
+        rows, cols = rows[upper], cols[upper]
+        values = rng.integers(1, max_weight + 1, rows.size).astype(dtype)
+        weights[rows, cols] = values
+        weights[cols, rows] = values
+    return graph
@@ -1,10 +1,14 @@
 import time
 import random
-import heapq
-import matplotlib.pyplot as plt
 import numpy as np
 from math import inf
 
+import lab_paths  # noqa: F401  (makes lab3's csr_graph importable)
+from csr_graph import CSRGraph, with_unit_weights
+from priority_queues import choose_queue
+from path_matrices import hop_dtype
+from dense_graph import DenseGraph
+
 
 # --------------------------
 # Graph Generation Functions
@@ -39,32 +43,118 @@ def generate_dense_graph(n):
 
 
 # --------------------------
-# Dijkstra's Algorithm (for all nodes)
+# Weighted CSR conversion
 # --------------------------
-def dijkstra(graph):
+def matrix_to_csr(graph):
+    """
+    Turn an inf-filled weight matrix into a weighted CSRGraph. Diagonal entries
+    are dropped unless negative: a negative one is kept as a self-loop, the
+    one-vertex negative cycle that bellman_ford and spfa must report.
+    """
+    weights = np.asarray(graph, dtype=np.float64)
+    n = len(weights)
+    has_edge = np.isfinite(weights)
+    np.fill_diagonal(has_edge, np.diagonal(weights) < 0)
+    rows, cols = np.nonzero(has_edge)
+    return CSRGraph.from_sorted_rows(n, rows, cols, weights[rows, cols])
+
+
+def as_csr(graph):
+    """Weighted CSRGraph for any graph input; an unweighted CSRGraph gets unit weights"""
+    if isinstance(graph, CSRGraph):
+        return with_unit_weights(graph)
+    if isinstance(graph, DenseGraph):
+        return graph.to_csr()
+    return matrix_to_csr(graph)
+
+
+def check_non_negative(weights):
+    if weights.size and weights.min() < 0:
+        raise ValueError("Dijkstra requires non-negative edge weights. Use bellman_ford for negative ones.")
 
-    n = len(graph)
-    dist_matrix = [[inf for _ in range(n)] for _ in range(n)]
 
-    for src in range(n):
-        dist = [inf] * n
-        dist[src] = 0
-        visited = [False] * n
-        heap = [(0, src)]
+# --------------------------
+# Dijkstra's Algorithm (single source)
+# --------------------------
+def dijkstra_sssp(graph, source, targets=None, queue_factory=None):
+    """
+    Single-source Dijkstra over a weighted CSRGraph in O((V + E) log V).
+    Returns (dist, pred) NumPy arrays: dist is float64 with inf for unreached
+    vertices, pred is int32 with pred[source] = source and -1 for unreached.
+    With targets given, the search stops as soon as all of them are settled;
+    dist/pred are then exact only for settled vertices.
+    queue_factory (n -> queue) defaults to choose_queue(graph.weights): a Dial
+    queue for small integer weights, heapq otherwise.
+    Negative weights raise ValueError (use bellman_ford.py for those); an
+    unweighted graph counts every edge as 1.
+    """
+    graph = with_unit_weights(graph)
+    n = graph.num_vertices
+    offsets, neighbors, weights = graph.offsets, graph.targets, graph.weights
+    if queue_factory is None:
+        check_non_negative(weights)
+        queue_factory = choose_queue(weights)
+
+    dist = np.full(n, inf)
+    pred = np.full(n, -1, dtype=np.int32)
+    dist[source] = 0
+    pred[source] = source
+    remaining = None if targets is None else set(np.atleast_1d(targets).tolist())
+    queue = queue_factory(n)
+    queue.push(source, 0)
+
+    while queue:
+        _, u = queue.pop()
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+
+        # Relax all edges of u at once
+        lo, hi = offsets[u], offsets[u + 1]
+        if lo == hi:
+            continue
+        d = dist[u]
+        v = neighbors[lo:hi]
+        candidate = d + weights[lo:hi]
+        better = candidate < dist[v]
+        if not better.any():
+            continue
+        v, candidate = v[better], candidate[better]
+        # minimum.at keeps the best of parallel edges (possible in imported graph files)
+        np.minimum.at(dist, v, candidate)
+        improved = candidate == dist[v]
+        pred[v[improved]] = u
+        # push() lowers the key of already queued vertices instead of adding entries
+        for vertex, dv in zip(v[improved].tolist(), candidate[improved].tolist()):
+            queue.push(vertex, dv)
+
+    return dist, pred
 
-        while heap:
-            d, u = heapq.heappop(heap)
-            if visited[u]:
-                continue
-            visited[u] = True
 
-            for v in range(n):
-                if graph[u][v] != inf and dist[v] > d + graph[u][v]:
-                    dist[v] = d + graph[u][v]
-                    heapq.heappush(heap, (dist[v], v))
+# --------------------------
+# Dijkstra's Algorithm (for all nodes)
+# --------------------------
+def dijkstra(graph, return_predecessors=False):
+    """
+    All-pairs shortest paths as an n x n array: one dijkstra_sssp per source.
+    With return_predecessors=True returns (dist_matrix, pred_matrix), where
+    pred_matrix[s] is the predecessor row of source s (int16/int32, -1 if unreached).
+    """
+    graph = as_csr(graph)
+    n = graph.num_vertices
+    dist_matrix = np.empty((n, n))
+    pred_matrix = np.empty((n, n), dtype=hop_dtype(n)) if return_predecessors else None
+    check_non_negative(graph.weights)
+    queue_factory = choose_queue(graph.weights)
 
-        dist_matrix[src] = dist
+    for src in range(n):
+        dist_matrix[src], pred = dijkstra_sssp(graph, src, queue_factory=queue_factory)
+        if return_predecessors:
+            pred_matrix[src] = pred
 
+    if return_predecessors:
+        return dist_matrix, pred_matrix
     return dist_matrix
 
 
@@ -86,11 +176,23 @@ def run_experiment(graph_generator, max_nodes, step, num_trials=3):
     return node_counts, times
 
 
+def collect_results(max_nodes=200, step=10, num_trials=5):
+    print("Testing sparse graphs...")
+    sparse_nodes, sparse_time = run_experiment(generate_sparse_graph, max_nodes, step, num_trials)
+
+    print("Testing dense graphs...")
+    dense_nodes, dense_time = run_experiment(generate_dense_graph, max_nodes, step, num_trials)
+
+    return sparse_nodes, sparse_time, dense_time
+
+
 # --------------------------
 # Plotting Results
 # --------------------------
 def plot_results(node_counts, sparse_time, dense_time):
-    plt.figure(figsize=(8, 6))
+    import matplotlib.pyplot as plt
+
+    plt.figure("dijkstra_performance", figsize=(8, 6))
 
     plt.plot(node_counts, sparse_time, 'o-', label='Sparse Graph')
     plt.plot(node_counts, dense_time, 's-', label='Dense Graph')
@@ -108,21 +210,13 @@ def plot_results(node_counts, sparse_time, dense_time):
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
 
 
 # --------------------------
 # Main Execution
 # --------------------------
 if __name__ == "__main__":
-    max_nodes = 200
-    step = 10
-    num_trials = 5
+    import matplotlib.pyplot as plt
 
-    print("Testing sparse graphs...")
-    sparse_nodes, sparse_time = run_experiment(generate_sparse_graph, max_nodes, step, num_trials)
-
-    print("Testing dense graphs...")
-    dense_nodes, dense_time = run_experiment(generate_dense_graph, max_nodes, step, num_trials)
-
-    plot_results(sparse_nodes, sparse_time, dense_time)
+    plot_results(*collect_results())
+    plt.show()
@@ -0,0 +1,106 @@
+import numpy as np
+from math import inf
+
+from floyd_warshall_numpy import floyd_warshall_inplace, to_distance_array
+
+
+# --------------------------
+# Dense multi-source Dijkstra
+# --------------------------
+def dense_dijkstra_rows(weights, sources):
+    """
+    Shortest distances from each of sources over a dense non-negative weight matrix,
+    as a len(sources) x n array. All rows advance together: every iteration settles
+    the closest open vertex of each row and relaxes its whole weight row at once.
+    """
+    sources = np.asarray(sources)
+    k, n = len(sources), len(weights)
+    rows = np.arange(k)
+    dist = np.full((k, n), inf)
+    dist[rows, sources] = 0
+    open_dist = dist.copy()  # dist with settled vertices masked out as inf
+
+    for _ in range(n):
+        u = np.argmin(open_dist, axis=1)
+        du = open_dist[rows, u]
+        active = np.isfinite(du)
+        if not active.any():
+            break
+        rows_a, u_a = rows[active], u[active]
+        open_dist[rows_a, u_a] = inf
+        candidate = du[active, None] + weights[u_a]
+        improved = candidate < dist[rows_a]
+        r, v = np.nonzero(improved)
+        dist[rows_a[r], v] = candidate[r, v]
+        open_dist[rows_a[r], v] = candidate[r, v]
+    return dist
+
+
+# --------------------------
+# Dynamic all-pairs shortest paths
+# --------------------------
+class DynamicAPSP:
+    """
+    All-pairs distance matrix kept up to date under edge weight changes.
+    Built once with Floyd-Warshall; then
+      - an insertion or weight decrease is one O(n^2) vectorized relaxation
+        through the changed edge,
+      - a weight increase or removal recomputes only the source rows whose
+        shortest paths used the edge (dense Dijkstra on those rows).
+    Weights must be non-negative. Each update returns the number of rows it
+    changed or recomputed; rows_touched accumulates them.
+    """
+
+    def __init__(self, graph, undirected=False):
+        self.weights = to_distance_array(graph)
+        if (self.weights < 0).any():
+            raise ValueError("DynamicAPSP requires non-negative edge weights.")
+        self.undirected = undirected
+        self.dist = floyd_warshall_inplace(self.weights.copy())
+        self.rows_touched = 0
+
+    def distance(self, u, v):
+        return self.dist[u, v]
+
+    def update_edge(self, u, v, weight):
+        """Set the weight of edge u -> v (and v -> u if undirected); inf removes it"""
+        if weight < 0:
+            raise ValueError("DynamicAPSP requires non-negative edge weights.")
+        if u == v:
+            return 0
+        edges = [(u, v), (v, u)] if self.undirected else [(u, v)]
+        old = self.weights[u, v]
+        if weight == old:
+            return 0
+        for a, b in edges:
+            self.weights[a, b] = weight
+        touched = self._decrease(edges, weight) if weight < old else self._increase(edges, old)
+        self.rows_touched += touched
+        return touched
+
+    def remove_edge(self, u, v):
+        return self.update_edge(u, v, inf)
+
+    def _decrease(self, edges, weight):
+        # d(s, t) = min(d(s, t), d(s, a) + w + d(b, t)) for the new edge a -> b
+        dist = self.dist
+        changed = np.zeros(len(dist), dtype=bool)
+        scratch = np.empty_like(dist)
+        for a, b in edges:
+            np.add(dist[:, a, None] + weight, dist[None, b, :], out=scratch)
+            better = scratch < dist
+            np.copyto(dist, scratch, where=better)
+            changed |= better.any(axis=1)
+        return int(changed.sum())
+
+    def _increase(self, edges, old):
+        # Only sources for which some old edge a -> b was tight can lose a shortest path
+        dist = self.dist
+        affected = np.zeros(len(dist), dtype=bool)
+        for a, b in edges:
+            via_edge = dist[:, a] + old
+            affected |= np.isfinite(via_edge) & np.isclose(via_edge, dist[:, b])
+        rows = np.flatnonzero(affected)
+        if rows.size:
+            dist[rows] = dense_dijkstra_rows(self.weights, rows)
+        return int(rows.size)
@@ -0,0 +1,154 @@
+import numpy as np
+from math import inf
+
+from path_matrices import hop_dtype
+from dense_graph import DenseGraph
+
+
+# --------------------------
+# Compact distance matrices
+# --------------------------
+def infinity_of(dtype):
+    """
+    "No path" value for a distance dtype. Floats use inf. Integers use a quarter of
+    the dtype's maximum, so INF + INF still fits and sums through missing edges
+    stay >= INF until they are clamped back.
+    """
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.floating):
+        return dtype.type(inf)
+    return dtype.type(np.iinfo(dtype).max // 4)
+
+
+def choose_distance_dtype(n, max_weight, integer=True):
+    """Smallest dtype whose infinity sentinel exceeds the longest possible path (n - 1) * max_weight"""
+    if not integer:
+        return np.float64
+    longest = max(n - 1, 1) * max_weight
+    for dtype in (np.int16, np.int32, np.int64):
+        if longest < infinity_of(dtype) // 2:
+            return dtype
+    return np.float64
+
+
+def _max_integer_weight(dtype, n):
+    """Largest |weight| whose (n - 1)-edge paths stay below half of the integer sentinel (None for floats)"""
+    if np.issubdtype(np.dtype(dtype), np.floating):
+        return None
+    return (int(infinity_of(dtype)) // 2 - 1) // max(n - 1, 1)
+
+
+def _copy_weights(weights, out, infinity, max_weight):
+    """Copy one block of float64 weights into out, refusing weights the integer sentinel cannot hold"""
+    present = np.isfinite(weights)
+    values = weights[present]
+    if max_weight is not None and values.size:
+        if (values != np.round(values)).any():
+            raise ValueError(f"Edge weights must be integers for {out.dtype.name} distances.")
+        if np.abs(values).max() > max_weight:
+            raise ValueError(f"Edge weight {np.abs(values).max():g} can make paths overflow "
+                             f"{out.dtype.name} distances. Use choose_distance_dtype.")
+    out[present] = values
+    out[~present] = infinity
+
+
+def to_distance_array(graph, dtype=np.float64):
+    """
+    Copy an inf-filled weight matrix (list of lists, array or DenseGraph) into an
+    n x n array of the given dtype, with inf replaced by the dtype's sentinel and a
+    zero diagonal. A DenseGraph is converted one block of rows at a time.
+    For integer dtypes every weight must be an integer and every path of n - 1
+    edges must stay below infinity_of(dtype) // 2, otherwise ValueError is raised.
+    """
+    infinity = infinity_of(dtype)
+    if isinstance(graph, DenseGraph):
+        n = graph.num_vertices
+        dist = np.empty((n, n), dtype=dtype)
+        max_weight = _max_integer_weight(dtype, n)
+        step = graph.block_rows()
+        for start in range(0, n, step):
+            stop = min(start + step, n)
+            _copy_weights(graph.rows(start, stop), dist[start:stop], infinity, max_weight)
+    else:
+        weights = np.asarray(graph, dtype=np.float64)
+        dist = np.empty(weights.shape, dtype=dtype)
+        max_weight = _max_integer_weight(dtype, len(weights))
+        _copy_weights(weights, dist, infinity, max_weight)
+    diagonal = np.einsum("ii->i", dist)
+    np.minimum(diagonal, 0, out=diagonal)
+    return dist
+
+
+# --------------------------
+# Floyd-Warshall Algorithm (vectorized)
+# --------------------------
+def initial_next_hop(dist):
+    """Next-hop matrix of the direct edges: next[i, j] = j for an edge, i on the diagonal, -1 otherwise"""
+    n = len(dist)
+    next_hop = np.full((n, n), -1, dtype=hop_dtype(n))
+    rows, cols = np.nonzero(dist < infinity_of(dist.dtype))
+    next_hop[rows, cols] = cols
+    np.fill_diagonal(next_hop, np.arange(n))
+    return next_hop
+
+
+def floyd_warshall_inplace(dist, block_rows=None, next_hop=None):
+    """
+    Run Floyd-Warshall on a square distance array in place. Every k-step is
+    D = min(D, D[:, k, None] + D[None, k, :]), evaluated over blocks of rows into
+    one reusable scratch buffer, so no n x n temporary is created per step.
+    If a next_hop matrix (see initial_next_hop) is given it is updated in place too.
+    """
+    n = len(dist)
+    if block_rows is None:
+        # About 4 MB of scratch: large enough to amortize NumPy call overhead
+        block_rows = max(1, (4 << 20) // max(dist.itemsize * n, 1))
+    block_rows = min(block_rows, max(n, 1))
+    scratch = np.empty((block_rows, n), dtype=dist.dtype)
+    if next_hop is not None:
+        shorter = np.empty((block_rows, n), dtype=bool)
+
+    for k in range(n):
+        # Row and column k do not change during step k (D[k, k] >= 0), copy them once
+        row = dist[k].copy()
+        column = dist[:, k].copy()
+        if next_hop is not None:
+            hop_to_k = next_hop[:, k].copy()
+        for start in range(0, n, block_rows):
+            stop = min(start + block_rows, n)
+            through_k = scratch[:stop - start]
+            np.add(column[start:stop, None], row[None, :], out=through_k)
+            if next_hop is not None:
+                # Paths that get shorter via k now start the same way as the path to k
+                improved = shorter[:stop - start]
+                np.less(through_k, dist[start:stop], out=improved)
+                np.copyto(next_hop[start:stop], hop_to_k[start:stop, None], where=improved)
+            np.minimum(dist[start:stop], through_k, out=dist[start:stop])
+
+    if not np.issubdtype(dist.dtype, np.floating):
+        # Saturate: anything that went through a missing edge is still "no path"
+        infinity = infinity_of(dist.dtype)
+        unreachable = dist > infinity // 2
+        dist[unreachable] = infinity
+        if next_hop is not None:
+            next_hop[unreachable] = -1
+    return dist
+
+
+def floyd_warshall_numpy(graph, dtype=np.float64, return_next=False):
+    """
+    All-pairs shortest paths from an inf-filled weight matrix as an n x n array.
+    dtype may be float32/float64 (inf for no path) or an integer type (the
+    infinity_of(dtype) sentinel for no path); see choose_distance_dtype.
+    With return_next=True returns (dist, next_hop) for path_matrices.iter_path.
+    """
+    dist = to_distance_array(graph, dtype)
+    if not return_next:
+        return floyd_warshall_inplace(dist)
+    next_hop = initial_next_hop(dist)
+    return floyd_warshall_inplace(dist, next_hop=next_hop), next_hop
+
+
+def has_negative_cycle(dist):
+    """A Floyd-Warshall result contains a negative cycle iff some D[i, i] < 0"""
+    return bool((np.diagonal(dist) < 0).any())
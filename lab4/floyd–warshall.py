@@ -1,9 +1,10 @@
 import time
 import random
-import matplotlib.pyplot as plt
 import numpy as np
 from math import inf
 
+from floyd_warshall_numpy import floyd_warshall_numpy
+
 
 # --------------------------
 # Graph Generation Functions
@@ -42,7 +43,8 @@ def generate_dense_graph(n):
 # --------------------------
 # Floyd-Warshall Algorithm (Dynamic Programming)
 # --------------------------
-def floyd_warshall(graph):
+def floyd_warshall_lists(graph):
+    """Reference triple loop over lists of lists"""
     n = len(graph)
     dist = [row[:] for row in graph]
     for k in range(n):
@@ -53,6 +55,14 @@ def floyd_warshall(graph):
     return dist
 
 
+def floyd_warshall(graph, dtype=np.float64, return_next=False):
+    """
+    All-pairs shortest paths as an n x n array (vectorized k-steps, see floyd_warshall_numpy.py).
+    With return_next=True also returns the next-hop matrix for path reconstruction.
+    """
+    return floyd_warshall_numpy(graph, dtype, return_next)
+
+
 # --------------------------
 # Empirical Analysis
 # --------------------------
@@ -71,11 +81,23 @@ def run_experiment(graph_generator, max_nodes, step, num_trials=3):
     return node_counts, times
 
 
+def collect_results(max_nodes=200, step=10, num_trials=5):
+    print("Testing sparse graphs...")
+    sparse_nodes, sparse_time = run_experiment(generate_sparse_graph, max_nodes, step, num_trials)
+
+    print("Testing dense graphs...")
+    dense_nodes, dense_time = run_experiment(generate_dense_graph, max_nodes, step, num_trials)
+
+    return sparse_nodes, sparse_time, dense_time
+
+
 # --------------------------
 # Plotting Results
 # --------------------------
 def plot_results(node_counts, sparse_time, dense_time):
-    plt.figure(figsize=(8, 6))
+    import matplotlib.pyplot as plt
+
+    plt.figure("floyd_warshall_performance", figsize=(8, 6))
 
     plt.plot(node_counts, sparse_time, 'o-', label='Sparse Graph (O(n³))')
     plt.plot(node_counts, dense_time, 's-', label='Dense Graph (O(n³))')
@@ -93,21 +115,13 @@ def plot_results(node_counts, sparse_time, dense_time):
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
 
 
 # --------------------------
 # Main Execution
 # --------------------------
 if __name__ == "__main__":
-    max_nodes = 200
-    step = 10
-    num_trials = 5
-
-    print("Testing sparse graphs...")
-    sparse_nodes, sparse_time = run_experiment(generate_sparse_graph, max_nodes, step, num_trials)
+    import matplotlib.pyplot as plt
 
-    print("Testing dense graphs...")
-    dense_nodes, dense_time = run_experiment(generate_dense_graph, max_nodes, step, num_trials)
-
-    plot_results(sparse_nodes, sparse_time, dense_time)
+    plot_results(*collect_results())
+    plt.show()
@@ -0,0 +1,97 @@
+import os
+
+import numpy as np
+
+import lab_paths  # noqa: F401  (makes lab3's csr_graph importable)
+from csr_graph import CSRGraph
+from bellman_ford import bellman_ford, spfa
+from dijkstra import as_csr, dijkstra
+from dense_graph import csr_to_matrix
+from floyd_warshall_numpy import floyd_warshall_numpy, has_negative_cycle
+from parallel_dijkstra import parallel_dijkstra
+
+
+# --------------------------
+# Reweighting
+# --------------------------
+def johnson_potentials(graph):
+    """
+    Vertex potentials h: distances from a virtual source joined to every vertex by a
+    0-weight edge, found with SPFA. Raises NegativeCycleError for a negative cycle.
+    """
+    if graph.weights.size == 0 or graph.weights.min() >= 0:
+        return np.zeros(graph.num_vertices)  # no negative edges: every potential stays 0
+    return spfa(graph)[0]
+
+
+def reweight(graph, h):
+    """CSRGraph with w'(u, v) = w(u, v) + h[u] - h[v] >= 0"""
+    sources = graph.edge_sources()
+    weights = graph.weights + h[sources] - h[graph.targets]
+    # Clip float rounding noise so Dijkstra never sees a tiny negative weight
+    np.maximum(weights, 0, out=weights)
+    return CSRGraph(graph.offsets, graph.targets, weights)
+
+
+# --------------------------
+# Johnson's Algorithm
+# --------------------------
+def johnson(graph, workers=1, block_size=16):
+    """
+    All-pairs shortest paths in O(VE log V) for a weighted CSRGraph or an
+    inf-filled weight matrix, returned as an n x n array. Negative edges are
+    allowed; a negative cycle raises NegativeCycleError. With workers > 1 (None means
+    os.cpu_count()) the searches run on parallel_dijkstra's shared-memory pool.
+    """
+    graph = as_csr(graph)
+    h = johnson_potentials(graph)
+    reweighted = reweight(graph, h)
+
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        dist = dijkstra(reweighted)
+    else:
+        dist = parallel_dijkstra(reweighted, workers, block_size)
+    # Undo the reweighting: d(s, v) = d'(s, v) - h[s] + h[v]
+    dist -= h[:, None]
+    dist += h[None, :]
+    return dist
+
+
+# --------------------------
+# Automatic selection
+# --------------------------
+# Rough per-operation costs (seconds) measured on the lab machine: one vectorized
+# Floyd-Warshall cell update, and one Dijkstra pop / edge relaxation in Johnson
+FW_CELL_COST = 2.5e-9
+JOHNSON_POP_COST = 1.2e-5
+JOHNSON_EDGE_COST = 2e-7
+JOHNSON_MAX_DENSITY = 0.05
+
+
+def prefer_johnson(n, m, max_density=JOHNSON_MAX_DENSITY):
+    """
+    True when Johnson is expected to beat Floyd-Warshall: the edge density
+    m / (n (n - 1)) must be at most max_density and n (n POP + m EDGE) < n^3 CELL.
+    For the ~4-neighbour lab graphs this holds from a few thousand vertices on.
+    """
+    density = m / max(n * (n - 1), 1)
+    if density > max_density:
+        return False
+    return n * JOHNSON_POP_COST + m * JOHNSON_EDGE_COST < n * n * FW_CELL_COST
+
+
+def all_pairs_shortest_paths(graph, workers=1, max_density=JOHNSON_MAX_DENSITY):
+    """
+    All-pairs shortest paths as an n x n float64 array, using Johnson for large
+    sparse graphs (see prefer_johnson) and Floyd-Warshall otherwise.
+    Either way a negative cycle raises NegativeCycleError.
+    """
+    csr = as_csr(graph)
+    if prefer_johnson(csr.num_vertices, csr.num_edges, max_density):
+        return johnson(csr, workers)
+    matrix = csr_to_matrix(csr) if isinstance(graph, CSRGraph) else graph
+    dist = floyd_warshall_numpy(matrix)
+    if has_negative_cycle(dist):
+        bellman_ford(csr)  # raises NegativeCycleError with the cycle
+    return dist
@@ -0,0 +1,62 @@
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+import lab_paths  # noqa: F401  (makes lab3's csr_graph and shared_arrays importable)
+from csr_graph import CSRGraph
+from shared_arrays import SharedArrays, attach_worker, worker_state
+from dijkstra import as_csr, dijkstra_sssp
+from path_matrices import hop_dtype
+from priority_queues import choose_queue
+
+
+# All-pairs Dijkstra over a process pool. The CSR arrays are copied into shared
+# memory once and the output matrices are allocated there too; workers take
+# blocks of sources and write their rows straight into the shared output, so
+# neither the graph nor any result row is ever pickled.
+
+def _setup_worker(state):
+    """Build the worker's graph view and queue factory once, after its arrays are attached"""
+    state["graph"] = CSRGraph(state["offsets"], state["targets"], state["weights"])
+    state["queue_factory"] = choose_queue(state["weights"])
+
+
+def _dijkstra_rows(bounds):
+    """Worker body: fill the distance (and predecessor) rows of sources start..stop-1"""
+    start, stop = bounds
+    graph, queue_factory = worker_state["graph"], worker_state["queue_factory"]
+    dist_out, pred_out = worker_state["dist"], worker_state.get("pred")
+    for src in range(start, stop):
+        dist_out[src], pred = dijkstra_sssp(graph, src, queue_factory=queue_factory)
+        if pred_out is not None:
+            pred_out[src] = pred
+
+
+def parallel_dijkstra(graph, workers=None, block_size=16, return_predecessors=False):
+    """
+    All-pairs shortest paths like dijkstra.dijkstra, with blocks of block_size
+    sources handed out to workers processes (default os.cpu_count()).
+    Returns the n x n distance array, or (dist, pred) with return_predecessors=True.
+    """
+    graph = as_csr(graph)
+    n = graph.num_vertices
+    workers = workers or os.cpu_count()
+
+    arrays = [("offsets", graph.offsets), ("targets", graph.targets), ("weights", graph.weights),
+              ("dist", np.empty((n, n)))]
+    if return_predecessors:
+        arrays.append(("pred", np.empty((n, n), dtype=hop_dtype(n))))
+    with SharedArrays(arrays) as shared:
+        bounds = [(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+        with Pool(workers, initializer=attach_worker, initargs=(shared.specs, _setup_worker)) as pool:
+            # Unordered with one block per task: fast workers simply take more blocks
+            for _ in pool.imap_unordered(_dijkstra_rows, bounds):
+                pass
+
+        dist = shared.views["dist"].copy()
+        pred = shared.views["pred"].copy() if return_predecessors else None
+
+    if return_predecessors:
+        return dist, pred
+    return dist
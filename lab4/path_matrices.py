@@ -0,0 +1,59 @@
+import numpy as np
+
+
+# --------------------------
+# Path reconstruction from all-pairs results
+# --------------------------
+# Two compact n x n matrices are produced by the all-pairs engines:
+#   next hop     next_hop[s, t] is the vertex after s on the path s -> t
+#                (floyd_warshall_numpy with return_next=True)
+#   predecessor  pred[s, t] is the vertex before t on the path s -> t
+#                (dijkstra with return_predecessors=True)
+# Both use -1 for "no path" and s itself on the diagonal.
+
+def hop_dtype(n):
+    """int16 when every vertex index fits, int32 otherwise"""
+    return np.int16 if n < 1 << 15 else np.int32
+
+
+def iter_path(next_hop, source, target):
+    """Yield the vertices of the path source -> target from a next-hop matrix, in order"""
+    if next_hop[source, target] == -1:
+        raise ValueError(f"Path from {source} to {target} does not exist.")
+    vertex = source
+    yield vertex
+    while vertex != target:
+        vertex = int(next_hop[vertex, target])
+        yield vertex
+
+
+def iter_path_reversed(pred, source, target):
+    """Yield the vertices of the path source -> target from a predecessor matrix, target first"""
+    if pred[source, target] == -1:
+        raise ValueError(f"Path from {source} to {target} does not exist.")
+    row = pred[source]
+    vertex = target
+    yield vertex
+    while vertex != source:
+        vertex = int(row[vertex])
+        yield vertex
+
+
+def path_from_predecessors(pred, source, target):
+    """Path source -> target as a list, from a predecessor matrix"""
+    path = list(iter_path_reversed(pred, source, target))
+    path.reverse()
+    return path
+
+
+# --------------------------
+# Storage
+# --------------------------
+def save_path_matrix(path, matrix):
+    """Write a next-hop or predecessor matrix as a .npy file"""
+    np.save(path, np.ascontiguousarray(matrix))
+
+
+def load_path_matrix(path):
+    """Memory-map a saved matrix read-only; lookups only touch the rows they walk"""
+    return np.load(path, mmap_mode="r")
@@ -0,0 +1,209 @@
+import numpy as np
+from math import inf
+
+import lab_paths  # noqa: F401  (makes lab3's csr_graph and search_scratch importable)
+from search_scratch import SearchScratch
+from dijkstra import as_csr, dijkstra_sssp
+from priority_queues import HeapQueue, choose_queue
+
+
+# --------------------------
+# ALT landmark lower bounds
+# --------------------------
+def choose_landmarks(graph, count, seed=None):
+    """
+    Farthest-point landmark selection: start from the vertex farthest from a random
+    one, then repeatedly add the vertex farthest from all landmarks chosen so far.
+    """
+    n = graph.num_vertices
+    rng = np.random.default_rng(seed)
+    start = int(rng.integers(n))
+    closest = dijkstra_sssp(graph, start)[0]
+    landmarks = []
+    for _ in range(min(count, n)):
+        # Unreachable vertices count as far away only if nothing else is left
+        reachable = np.where(np.isfinite(closest), closest, -1)
+        reachable[landmarks] = -2
+        landmark = int(np.argmax(reachable))
+        landmarks.append(landmark)
+        if len(landmarks) == 1:
+            closest = np.full(n, inf)
+        np.minimum(closest, dijkstra_sssp(graph, landmark)[0], out=closest)
+    return landmarks
+
+
+class LandmarkHeuristic:
+    """
+    ALT lower bound on d(v, t) from the triangle inequality with every landmark L:
+    max(d(L, t) - d(L, v), d(v, L) - d(t, L)). Consistent, so A* settles each
+    vertex once. Needs one forward and one backward Dijkstra tree per landmark.
+    """
+
+    def __init__(self, graph, landmarks, reverse_graph=None):
+        graph = as_csr(graph)
+        reverse_graph = reverse_graph if reverse_graph is not None else graph.transpose()
+        self.landmarks = list(landmarks)
+        # from_landmark[i, v] = d(L_i, v), to_landmark[i, v] = d(v, L_i)
+        self.from_landmark = np.array([dijkstra_sssp(graph, L)[0] for L in self.landmarks])
+        self.to_landmark = np.array([dijkstra_sssp(reverse_graph, L)[0] for L in self.landmarks])
+
+    def __call__(self, vertices, target):
+        with np.errstate(invalid="ignore"):
+            forward = self.from_landmark[:, target, None] - self.from_landmark[:, vertices]
+            backward = self.to_landmark[:, vertices] - self.to_landmark[:, target, None]
+        # inf - inf (landmark reaches neither) says nothing: treat it as 0
+        bound = np.fmax(forward, backward)
+        bound = np.where(np.isnan(bound), 0, bound).max(axis=0)
+        return np.maximum(bound, 0)
+
+
+# --------------------------
+# Point-to-point query engine
+# --------------------------
+class PointToPointEngine:
+    """
+    Single s -> t shortest path queries that stop long before a full search would.
+      bidirectional  Dijkstra from s and (on the reversed graph) from t, stopping
+                     once the two popped keys add up to the best meeting distance mu
+      astar          A* from s guided by heuristic(vertices, t) -> lower bounds,
+                     by default ALT bounds from num_landmarks landmarks
+    Scratch arrays (a SearchScratch, as in lab3's HopQueryEngine) and the queues
+    are allocated once and reused across queries.
+    Weights must be non-negative.
+    """
+
+    def __init__(self, graph, reverse_graph=None, heuristic=None, num_landmarks=8, seed=None):
+        graph = as_csr(graph)
+        if reverse_graph is None:
+            reverse_graph = graph.transpose()
+        self.graphs = (graph, reverse_graph)
+        n = graph.num_vertices
+        if heuristic is None and num_landmarks and n:
+            heuristic = LandmarkHeuristic(graph, choose_landmarks(graph, num_landmarks, seed), reverse_graph)
+        self.heuristic = heuristic
+
+        # Row 0 belongs to the search from s, row 1 to the backward search from t
+        self._scratch = SearchScratch(n, np.float64)
+        queue_factory = choose_queue(graph.weights)
+        self._queues = (queue_factory(n), queue_factory(n))
+        self._astar_queue = HeapQueue(n)
+
+    def _relax(self, side, u, generation):
+        """Relax the edges of u on one side; returns (improved vertices, their distances)"""
+        graph = self.graphs[side]
+        scratch = self._scratch
+        stamp, dist, pred = scratch.stamp[side], scratch.dist[side], scratch.parent[side]
+        lo, hi = graph.offsets[u], graph.offsets[u + 1]
+        v = graph.targets[lo:hi]
+        candidate = dist[u] + graph.weights[lo:hi]
+        # Vertices not seen in this query have a stale dist: treat it as inf
+        better = (stamp[v] != generation) | (candidate < dist[v])
+        v, candidate = v[better], candidate[better]
+        if v.size:
+            # Parallel edges: keep the lightest candidate per vertex
+            order = np.lexsort((candidate, v))
+            v, candidate = v[order], candidate[order]
+            first = np.ones(v.size, dtype=bool)
+            np.not_equal(v[1:], v[:-1], out=first[1:])
+            v, candidate = v[first], candidate[first]
+            stamp[v] = generation
+            dist[v] = candidate
+            pred[v] = u
+        return v, candidate
+
+    def bidirectional(self, s, t):
+        """Return (distance, path, settled); distance is inf and path empty when t is unreachable"""
+        generation = self._scratch.next_generation()
+        if s == t:
+            return 0.0, [s], 1
+        for side, root in ((0, s), (1, t)):
+            self._scratch.start(side, root)
+            self._queues[side].push(root, 0)
+        last_key = [0, 0]
+        mu, meet = inf, -1
+        settled = 0
+
+        while self._queues[0] and self._queues[1]:
+            # Grow the ball with the smaller radius
+            side = 0 if last_key[0] <= last_key[1] else 1
+            other = 1 - side
+            key, u = self._queues[side].pop()
+            last_key[side] = key
+            # Every undiscovered s-t path is at least as long as the two radii together
+            if key + last_key[other] >= mu:
+                break
+            settled += 1
+
+            v, candidate = self._relax(side, u, generation)
+            for vertex, dv in zip(v.tolist(), candidate.tolist()):
+                self._queues[side].push(vertex, dv)
+            # Candidate meeting points: vertices the other search has reached
+            seen = self._scratch.stamp[other, v] == generation
+            if seen.any():
+                total = candidate[seen] + self._scratch.dist[other, v[seen]]
+                best = int(np.argmin(total))
+                if total[best] < mu:
+                    mu, meet = float(total[best]), int(v[seen][best])
+
+        for queue in self._queues:
+            while queue:
+                queue.pop()
+        if meet == -1:
+            return inf, [], settled
+        return mu, self._scratch.walk(0, meet)[::-1] + self._scratch.walk(1, meet)[1:], settled
+
+    def astar(self, s, t):
+        """Return (distance, path, settled) using A* with the engine's heuristic"""
+        generation = self._scratch.next_generation()
+        heuristic = self.heuristic
+        queue = self._astar_queue
+        self._scratch.start(0, s)
+        queue.push(s, 0)
+        settled = 0
+        found = False
+
+        while queue:
+            _, u = queue.pop()
+            settled += 1
+            if u == t:
+                found = True
+                break
+            v, candidate = self._relax(0, u, generation)
+            if not v.size:
+                continue
+            estimate = candidate if heuristic is None else candidate + heuristic(v, t)
+            for vertex, key in zip(v.tolist(), estimate.tolist()):
+                if key < inf:  # an infinite bound means t is unreachable from vertex
+                    queue.push(vertex, key)
+
+        while queue:
+            queue.pop()
+        if not found:
+            return inf, [], settled
+        return float(self._scratch.dist[0, t]), self._scratch.walk(0, t)[::-1], settled
+
+    def query(self, s, t, method="bidirectional"):
+        if method == "bidirectional":
+            return self.bidirectional(s, t)
+        if method == "astar":
+            return self.astar(s, t)
+        raise ValueError(f"Query method '{method}' does not exist.")
+
+    def query_batch(self, pairs, method="bidirectional"):
+        """
+        Run many (s, t) queries on the same scratch arrays and queues.
+        Returns (distances, paths, settled) with float64/int64 arrays and a list of paths.
+        """
+        distances = np.empty(len(pairs))
+        settled = np.empty(len(pairs), dtype=np.int64)
+        paths = []
+        for i, (s, t) in enumerate(pairs):
+            distances[i], path, settled[i] = self.query(int(s), int(t), method)
+            paths.append(path)
+        return distances, paths, settled
+
+
+def shortest_path(graph, s, t):
+    """One-off bidirectional Dijkstra query returning (distance, path)"""
+    distance, path, _ = PointToPointEngine(graph, num_landmarks=0).query(s, t)
+    return distance, path
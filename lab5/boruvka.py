@@ -0,0 +1,145 @@
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+import lab_paths  # noqa: F401  (makes lab3's csr_graph/shared_arrays and lab4's dense_graph importable)
+from csr_graph import CSRGraph, sorted_unique, with_unit_weights
+from shared_arrays import SharedArrays, attach_worker, worker_state
+from dense_graph import as_dense_graph
+from kruskal import csr_is_symmetric
+from union_find import UnionFind
+
+
+# --------------------------
+# Borůvka's Algorithm
+# --------------------------
+# Every round each component picks its cheapest outgoing edge, ties broken by
+# edge id so the order is strict and the picked edges never close a cycle. All of
+# them join the MST at once, the union-find contracts the components and edges
+# that now lie inside one component are dropped, so O(log V) rounds remain.
+
+NO_EDGE = np.iinfo(np.int64).max
+
+
+def _segmented_min(components, weights, ids, num_components):
+    """
+    Cheapest (weight, then id) entry of every component present, as (components,
+    weights, ids). Two np.minimum.at passes over component-indexed arrays, which
+    is O(m) instead of the O(m log m) of a lexsort segmented minimum.
+    """
+    best_weight = np.full(num_components, np.inf)
+    np.minimum.at(best_weight, components, weights)
+    tie = weights == best_weight[components]
+    best_id = np.full(num_components, NO_EDGE)
+    np.minimum.at(best_id, components[tie], ids[tie])
+    present = np.flatnonzero(best_id != NO_EDGE)
+    return present, best_weight[present], best_id[present]
+
+
+def _filter_and_select(labels, sources, targets, weights, ids):
+    """
+    Compact the edge arrays in place to the edges joining two components and
+    return (kept, components, weights, ids): the count of kept edges and every
+    component's cheapest kept edge.
+    """
+    source_label, target_label = labels[sources], labels[targets]
+    crossing = source_label != target_label
+    kept = int(crossing.sum())
+    for array in (sources, targets, weights, ids):
+        array[:kept] = array[crossing]
+    source_label, target_label = source_label[crossing], target_label[crossing]
+
+    # Both ends of an edge compete for their own component
+    components = np.concatenate((source_label, target_label))
+    edge_weights = np.concatenate((weights[:kept], weights[:kept]))
+    edge_ids = np.concatenate((ids[:kept], ids[:kept]))
+    return (kept,) + _segmented_min(components, edge_weights, edge_ids, len(labels))
+
+
+def _select_chunk(task):
+    """Worker body: filter one chunk of the shared edge arrays and select its minima"""
+    start, live = task
+    stop = start + live
+    state = worker_state
+    return _filter_and_select(state["labels"], state["sources"][start:stop], state["targets"][start:stop],
+                              state["weights"][start:stop], state["ids"][start:stop])
+
+
+def _merge_minima(parts, num_components):
+    """Combine per-chunk minima into one cheapest edge id per component"""
+    components = np.concatenate([part[1] for part in parts])
+    weights = np.concatenate([part[2] for part in parts])
+    ids = np.concatenate([part[3] for part in parts])
+    return _segmented_min(components, weights, ids, num_components)[2]
+
+
+def boruvka_edges(n, sources, targets, weights, workers=1, chunk_edges=1 << 20):
+    """
+    Borůvka's MST over edge arrays of an undirected graph (each edge once).
+    Returns the MST as (u, v, w) arrays. With workers > 1 (None means
+    os.cpu_count()) the edge arrays live in shared memory, split into chunks of
+    chunk_edges that workers filter and scan in parallel every round.
+    Raises ValueError if the graph is disconnected; a single vertex has an empty MST.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+
+    uf = UnionFind(n)
+    vertices = np.arange(n)
+    taken = []
+    workers = workers or os.cpu_count()
+
+    if workers == 1:
+        # Working copies: they shrink every round as inner edges are dropped
+        work = [sources.copy(), targets.copy(), weights.copy(), np.arange(len(weights))]
+        labels = uf.find_many(vertices)
+        while uf.count > 1:
+            kept, _, _, picked = _filter_and_select(labels, *work)
+            if not kept:
+                break
+            work = [array[:kept] for array in work]
+            picked = sorted_unique(picked)
+            uf.union_many(sources[picked], targets[picked])
+            taken.append(picked)
+            labels = uf.find_many(vertices)
+    else:
+        arrays = (("sources", sources), ("targets", targets), ("weights", weights),
+                  ("ids", np.arange(len(weights))), ("labels", uf.find_many(vertices)))
+        with SharedArrays(arrays) as shared:
+            # Every chunk is compacted in place, so only its live prefix is scanned next round
+            starts = list(range(0, len(weights), chunk_edges))
+            live = [min(chunk_edges, len(weights) - start) for start in starts]
+            with Pool(workers, initializer=attach_worker, initargs=(shared.specs,)) as pool:
+                while uf.count > 1:
+                    parts = pool.map(_select_chunk, list(zip(starts, live)))
+                    live = [part[0] for part in parts]
+                    if not sum(live):
+                        break
+                    picked = sorted_unique(_merge_minima(parts, n))
+                    uf.union_many(sources[picked], targets[picked])
+                    taken.append(picked)
+                    shared.views["labels"][:] = uf.find_many(vertices)
+
+    if uf.count > 1:
+        raise ValueError("Graph is disconnected. MST does not exist.")
+    taken = np.concatenate(taken) if taken else np.empty(0, dtype=np.int64)
+    return sources[taken], targets[taken], weights[taken]
+
+
+def boruvka(graph, workers=1):
+    """Borůvka's MST over an inf-filled weight matrix, a DenseGraph or a CSRGraph (unit weights if it has none)"""
+    if isinstance(graph, CSRGraph):
+        graph = with_unit_weights(graph)
+        if not csr_is_symmetric(graph):
+            raise ValueError("Graph is directed. MST does not exist.")
+        sources = graph.edge_sources()
+        # Each undirected edge once (u < v)
+        upper = sources < graph.targets
+        return boruvka_edges(graph.num_vertices, sources[upper], graph.targets[upper], graph.weights[upper], workers)
+
+    graph = as_dense_graph(graph)
+    if not graph.is_symmetric():
+        raise ValueError("Graph is directed. MST does not exist.")
+    return boruvka_edges(graph.num_vertices, *graph.edge_arrays(upper=True), workers=workers)
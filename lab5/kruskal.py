@@ -1,73 +1,103 @@
 import time
 import random
-import matplotlib.pyplot as plt
 import numpy as np
 from math import inf
 
+import lab_paths  # noqa: F401  (makes lab3's csr_graph and lab4's dense_graph importable)
+from csr_graph import CSRGraph, with_unit_weights
+from dense_graph import as_dense_graph
+from union_find import UnionFind
+
 
 # --------------------------
 # Kruskal's Algorithm
 # --------------------------
-class UnionFind:
-    def __init__(self, n):
-        self.parent = list(range(n))
-        self.rank = [0] * n
-
-    def find(self, u):
-        if self.parent[u] != u:
-            self.parent[u] = self.find(self.parent[u])
-        return self.parent[u]
-
-    def union(self, u, v):
-        root_u = self.find(u)
-        root_v = self.find(v)
-        if root_u == root_v:
-            return False
-        if self.rank[root_u] < self.rank[root_v]:
-            self.parent[root_u] = root_v
-        else:
-            self.parent[root_v] = root_u
-            if self.rank[root_u] == self.rank[root_v]:
-                self.rank[root_u] += 1
-        return True
-
-
 def is_symmetric(graph):
-    n = len(graph)
-    for i in range(n):
-        for j in range(n):
-            if graph[i][j] != graph[j][i]:
-                return False
-    return True
-
-
-def kruskal(graph):
-    if not is_symmetric(graph):
-        raise ValueError("Graph is directed. MST does not exist.")
-
-    n = len(graph)
-    edges = []
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            if graph[i][j] != inf:
-                edges.append((graph[i][j], i, j))
-
-    if len(edges) == 0:
+    return as_dense_graph(graph).is_symmetric()
+
+
+def csr_is_symmetric(graph):
+    """A weighted CSRGraph is undirected iff it equals its transpose, edge for edge"""
+    sources = graph.edge_sources()
+    order = np.lexsort((graph.weights, graph.targets, sources))
+    transposed_order = np.lexsort((graph.weights, sources, graph.targets))
+    return (np.array_equal(sources[order], graph.targets[transposed_order])
+            and np.array_equal(graph.targets[order], sources[transposed_order])
+            and np.array_equal(graph.weights[order], graph.weights[transposed_order]))
+
+
+# Largest integer weight ordered by bucket sort instead of a comparison sort
+BUCKET_SORT_MAX_WEIGHT = np.iinfo(np.uint16).max
+
+
+def sort_edges(weights):
+    """
+    Stable order of the edges by weight. Small non-negative integer weights are
+    bucket sorted: NumPy's stable sort on 8/16-bit integers is an O(m) radix sort.
+    """
+    weights = np.asarray(weights)
+    if weights.size and weights.min() >= 0 and weights.max() <= BUCKET_SORT_MAX_WEIGHT \
+            and np.all(np.mod(weights, 1) == 0):
+        key_dtype = np.uint8 if weights.max() <= np.iinfo(np.uint8).max else np.uint16
+        return np.argsort(weights.astype(key_dtype), kind="stable")
+    return np.argsort(weights, kind="stable")
+
+
+def kruskal_edges(n, sources, targets, weights):
+    """
+    Kruskal's MST over native edge arrays of an undirected graph (each edge given
+    once, or in both directions). Returns the MST as (u, v, w) arrays in the order
+    the edges were taken. Raises ValueError if the graph is disconnected.
+    """
+    sources = np.asarray(sources)
+    targets = np.asarray(targets)
+    weights = np.asarray(weights)
+    if len(weights) == 0:
         raise ValueError("Graph has no edges.")
 
-    edges.sort()
+    order = sort_edges(weights)
     uf = UnionFind(n)
-    edge_count = 0
+    taken = []
+
+    # Edges are scanned in sorted chunks; one find_many per chunk drops every edge
+    # whose ends are already joined before the per-edge unions run
+    chunk = max(n, 1024)
+    for start in range(0, len(order), chunk):
+        block = order[start:start + chunk]
+        open_edges = uf.find_many(sources[block]) != uf.find_many(targets[block])
+        block = block[open_edges]
+        for i, u, v in zip(block.tolist(), sources[block].tolist(), targets[block].tolist()):
+            if uf.union(u, v):
+                taken.append(i)
+        if len(taken) == n - 1:
+            break
+
+    if len(taken) < n - 1:
+        raise ValueError("Graph is disconnected. MST does not exist.")
+    taken = np.array(taken, dtype=np.int64)
+    return sources[taken], targets[taken], weights[taken]
 
-    for weight, u, v in edges:
-        if uf.union(u, v):
-            edge_count += 1
-            if edge_count == n - 1:
-                return
 
-    if edge_count < n - 1:
-        raise ValueError("Graph is disconnected. MST does not exist.")
+def kruskal(graph):
+    """
+    Kruskal's MST over an inf-filled weight matrix, a DenseGraph or a weighted
+    CSRGraph (the latter never touches n^2 cells; missing weights count as 1).
+    Returns (u, v, w) arrays.
+    """
+    if isinstance(graph, CSRGraph):
+        graph = with_unit_weights(graph)
+        if not csr_is_symmetric(graph):
+            raise ValueError("Graph is directed. MST does not exist.")
+        sources = graph.edge_sources()
+        # Each undirected edge once (u < v)
+        upper = sources < graph.targets
+        return kruskal_edges(graph.num_vertices, sources[upper], graph.targets[upper], graph.weights[upper])
+
+    graph = as_dense_graph(graph)
+    if not graph.is_symmetric():
+        raise ValueError("Graph is directed. MST does not exist.")
+    # Each undirected edge once (u < v), collected a block of rows at a time
+    return kruskal_edges(graph.num_vertices, *graph.edge_arrays(upper=True))
 
 
 # --------------------------
@@ -209,11 +239,44 @@ def run_experiment(graph_generator, max_nodes, step, num_trials=3):
     return node_counts, times
 
 
+graph_generators = {
+    "Undirected": generate_undirected_graph,
+    "Directed": generate_directed_graph,
+    "Weighted": generate_weighted_graph,
+    "Unweighted": generate_unweighted_graph,
+    "Connected": generate_connected_graph,
+    "Disconnected": generate_disconnected_graph,
+    "Cyclic": generate_cyclic_graph,
+    "Acyclic": generate_acyclic_graph,
+    "Complete": generate_complete_graph,
+    "Sparse": generate_sparse_graph,
+    "Dense": generate_dense_graph,
+    "Tree": generate_tree_graph
+}
+
+
+def collect_results(max_nodes=300, step=10, num_trials=3):
+    results = {}
+    excluded = []
+    for label, generator in graph_generators.items():
+        print(f"Running on {label} graphs...")
+        x, y = run_experiment(generator, max_nodes=max_nodes, step=step, num_trials=num_trials)
+        if all(v is None for v in y):
+            print(f"  ⚠️ Skipping {label} from plot (Kruskal's not applicable).")
+            excluded.append(label)
+            results[label] = ([], [])
+        else:
+            results[label] = (x, y)
+    return results, excluded
+
+
 # --------------------------
 # Plotting Results
 # --------------------------
-def plot_all_results(results_dict, excluded_labels):
-    plt.figure(figsize=(10, 7))
+def plot_results(results_dict, excluded_labels):
+    import matplotlib.pyplot as plt
+
+    plt.figure("kruskal_performance", figsize=(10, 7))
     for label, (x, y) in results_dict.items():
         if label in excluded_labels:
             plt.plot([], [], marker='o', label=f"{label} (excluded)")
@@ -226,41 +289,13 @@ def plot_all_results(results_dict, excluded_labels):
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
 
 
 # --------------------------
 # Main Execution
 # --------------------------
-graph_generators = {
-    "Undirected": generate_undirected_graph,
-    "Directed": generate_directed_graph,
-    "Weighted": generate_weighted_graph,
-    "Unweighted": generate_unweighted_graph,
-    "Connected": generate_connected_graph,
-    "Disconnected": generate_disconnected_graph,
-    "Cyclic": generate_cyclic_graph,
-    "Acyclic": generate_acyclic_graph,
-    "Complete": generate_complete_graph,
-    "Sparse": generate_sparse_graph,
-    "Dense": generate_dense_graph,
-    "Tree": generate_tree_graph
-}
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
 
-max_nodes = 300
-step = 10
-num_trials = 3
-results = {}
-excluded = []
-
-for label, generator in graph_generators.items():
-    print(f"Running on {label} graphs...")
-    x, y = run_experiment(generator, max_nodes=max_nodes, step=step, num_trials=num_trials)
-    if all(v is None for v in y):
-        print(f"  ⚠️ Skipping {label} from plot (Kruskal's not applicable).")
-        excluded.append(label)
-        results[label] = ([], [])
-    else:
-        results[label] = (x, y)
-
-plot_all_results(results, excluded)
+    plot_results(*collect_results())
+    plt.show()
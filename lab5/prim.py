@@ -1,46 +1,126 @@
 import time
 import random
-import heapq
-import matplotlib.pyplot as plt
 import numpy as np
 from math import inf
 
+import lab_paths  # noqa: F401  (makes lab3's csr_graph and lab4's priority_queues/dense_graph importable)
+from csr_graph import CSRGraph, with_unit_weights
+from priority_queues import choose_queue
+from dense_graph import DenseGraph, as_dense_graph
+from kruskal import csr_is_symmetric
+
 # --------------------------
 # Prim's Algorithm
 # --------------------------
 def is_symmetric(graph):
-    n = len(graph)
-    for i in range(n):
-        for j in range(n):
-            if graph[i][j] != graph[j][i]:
-                return False
-    return True
-
-def prim(graph):
-    if not is_symmetric(graph):
-        raise ValueError("Graph is directed. MST does not exist.")
-
-    n = len(graph)
-    visited = [False] * n
-    min_edge = [inf] * n
-    min_edge[0] = 0
-    heap = [(0, 0)]
-    count = 0
-
-    while heap:
-        weight, u = heapq.heappop(heap)
-        if visited[u]:
+    return as_dense_graph(graph).is_symmetric()
+
+def _tree_edges(parent, key, order):
+    """MST edges (parent[v], v, key[v]) for every vertex but the root, in the order they joined"""
+    added = np.asarray(order[1:], dtype=np.int64)
+    return parent[added], added, key[added]
+
+def prim_dense(graph):
+    """
+    O(V^2) Prim over a DenseGraph: no heap, the key array lives in NumPy, the next
+    vertex is the argmin over keys of vertices outside the tree and every step
+    lowers the keys with one vectorized comparison against the new vertex's row.
+    Returns the MST as (u, v, w) arrays.
+    """
+    n = graph.num_vertices
+    key = np.full(n, inf)
+    parent = np.full(n, -1, dtype=np.int64)
+    in_tree = np.zeros(n, dtype=bool)
+    # key with tree vertices masked out as inf, so argmin never has to filter
+    open_key = np.full(n, inf)
+    open_key[0] = key[0] = 0
+    order = []
+
+    for _ in range(n):
+        u = int(np.argmin(open_key))
+        if open_key[u] == inf:
+            raise ValueError("Graph is disconnected. MST does not exist.")
+        in_tree[u] = True
+        open_key[u] = inf
+        order.append(u)
+
+        row = graph.row(u)
+        better = (row < open_key) & ~in_tree
+        open_key[better] = row[better]
+        key[better] = row[better]
+        parent[better] = u
+
+    return _tree_edges(parent, key, order)
+
+def prim_sparse(graph, queue_factory=None):
+    """
+    O(E log V) Prim over a weighted CSRGraph. queue_factory (n -> queue) defaults
+    to choose_queue(weights, monotone=False), as Prim's keys are not monotone.
+    Returns the MST as (u, v, w) arrays.
+    """
+    n = graph.num_vertices
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    key = np.full(n, inf)
+    parent = np.full(n, -1, dtype=np.int64)
+    in_tree = np.zeros(n, dtype=bool)
+    key[0] = 0
+    if queue_factory is None:
+        queue_factory = choose_queue(weights, monotone=False)
+    queue = queue_factory(n)
+    queue.push(0, 0)
+    order = []
+
+    while queue:
+        _, u = queue.pop()
+        in_tree[u] = True
+        order.append(u)
+
+        lo, hi = offsets[u], offsets[u + 1]
+        v, w = targets[lo:hi], weights[lo:hi]
+        better = (w < key[v]) & ~in_tree[v]
+        v, w = v[better], w[better]
+        if not v.size:
             continue
-        visited[u] = True
-        count += 1
-
-        for v in range(n):
-            if not visited[v] and graph[u][v] < min_edge[v]:
-                min_edge[v] = graph[u][v]
-                heapq.heappush(heap, (graph[u][v], v))
-
-    if count < n:
+        # Parallel edges: the lightest one wins
+        np.minimum.at(key, v, w)
+        won = w == key[v]
+        parent[v[won]] = u
+        for vertex, weight in zip(v[won].tolist(), w[won].tolist()):
+            queue.push(vertex, weight)
+
+    if len(order) < n:
         raise ValueError("Graph is disconnected. MST does not exist.")
+    return _tree_edges(parent, key, order)
+
+# Edge density m / (n (n - 1)) from which the dense O(V^2) variant is used: its
+# per-vertex row scan is vectorized, so it wins long before the graph is complete
+# (about 0.1 for random float weights at n = 3000)
+PRIM_DENSE_MIN_DENSITY = 0.1
+
+def prim(graph, dense_min_density=PRIM_DENSE_MIN_DENSITY):
+    """
+    Prim's MST over an inf-filled weight matrix, a DenseGraph or a CSRGraph (unit
+    weights if it has none). Picks prim_dense or prim_sparse by edge density;
+    returns (u, v, w) arrays.
+    """
+    if isinstance(graph, CSRGraph):
+        graph = with_unit_weights(graph)
+        if not csr_is_symmetric(graph):
+            raise ValueError("Graph is directed. MST does not exist.")
+        csr = graph
+        n = csr.num_vertices
+        if csr.num_edges >= dense_min_density * n * (n - 1):
+            return prim_dense(DenseGraph.from_csr(csr))
+        return prim_sparse(csr)
+
+    graph = as_dense_graph(graph)
+    if not graph.is_symmetric():
+        raise ValueError("Graph is directed. MST does not exist.")
+    n = graph.num_vertices
+    # Count edges block by block: the edge arrays are only built for prim_sparse
+    if graph.count_edges() >= dense_min_density * n * (n - 1):
+        return prim_dense(graph)
+    return prim_sparse(graph.to_csr())
 
 
 
@@ -177,11 +257,48 @@ def run_experiment(graph_generator, max_nodes, step, num_trials=3):
     return node_counts, times
 
 
+graph_generators = {
+    "Undirected": generate_undirected_graph,
+    "Directed": generate_directed_graph,
+    "Weighted": generate_weighted_graph,
+    "Unweighted": generate_unweighted_graph,
+    "Connected": generate_connected_graph,
+    "Disconnected": generate_disconnected_graph,
+    "Cyclic": generate_cyclic_graph,
+    "Acyclic": generate_acyclic_graph,
+    "Complete": generate_complete_graph,
+    "Sparse": generate_sparse_graph,
+    "Dense": generate_dense_graph,
+    "Tree": generate_tree_graph
+}
+
+
+def collect_results(max_nodes=300, step=10, num_trials=3):
+    results = {}
+    excluded = []
+
+    for label, generator in graph_generators.items():
+        print(f"Running on {label} graphs...")
+        x, y = run_experiment(generator, max_nodes=max_nodes, step=step, num_trials=num_trials)
+
+        # If all values are None, we assume it's invalid (Prim cannot build MST)
+        if all(v is None for v in y):
+            print(f"  ⚠️ Skipping {label} from plot (Prim's not applicable).")
+            excluded.append(label)
+            results[label] = ([], [])  # Placeholder for legend
+        else:
+            results[label] = (x, y)
+
+    return results, excluded
+
+
 # --------------------------
 # Plotting Results
 # --------------------------
-def plot_all_results(results_dict, excluded_labels):
-    plt.figure(figsize=(10, 7))
+def plot_results(results_dict, excluded_labels):
+    import matplotlib.pyplot as plt
+
+    plt.figure("prim_performance", figsize=(10, 7))
 
     for label, (x, y) in results_dict.items():
         if label in excluded_labels:
@@ -196,48 +313,13 @@ def plot_all_results(results_dict, excluded_labels):
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
-
 
 
 # --------------------------
 # Main Execution
 # --------------------------
-graph_generators = {
-    "Undirected": generate_undirected_graph,
-    "Directed": generate_directed_graph,
-    "Weighted": generate_weighted_graph,
-    "Unweighted": generate_unweighted_graph,
-    "Connected": generate_connected_graph,
-    "Disconnected": generate_disconnected_graph,
-    "Cyclic": generate_cyclic_graph,
-    "Acyclic": generate_acyclic_graph,
-    "Complete": generate_complete_graph,
-    "Sparse": generate_sparse_graph,
-    "Dense": generate_dense_graph,
-    "Tree": generate_tree_graph
-}
-
-max_nodes = 300
-step = 10
-num_trials = 3
-
-results = {}
-excluded = []
-
-for label, generator in graph_generators.items():
-    print(f"Running on {label} graphs...")
-    x, y = run_experiment(generator, max_nodes=max_nodes, step=step, num_trials=num_trials)
-
-    # If all values are None, we assume it's invalid (Prim cannot build MST)
-    if all(v is None for v in y):
-        print(f"  ⚠️ Skipping {label} from plot (Prim's not applicable).")
-        excluded.append(label)
-        results[label] = ([], [])  # Placeholder for legend
-    else:
-        results[label] = (x, y)
-
-
-# Plot
-plot_all_results(results, excluded)
+if __name__ == "__main__":
+    import matplotlib.pyplot as plt
 
+    plot_results(*collect_results())
+    plt.show()
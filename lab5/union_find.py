@@ -0,0 +1,105 @@
+import numpy as np
+
+import lab_paths  # noqa: F401  (makes lab3's csr_graph importable)
+from csr_graph import sorted_unique
+
+
+# Disjoint-set forest over elements 0..n-1 stored in NumPy arrays
+class UnionFind:
+    """
+    Union by size with iterative path halving, so no operation recurses and
+    universes of 10^7+ elements cost 8 bytes per element. count (number of
+    components) is kept up to date; size[root] is the size of root's component.
+    find_many / union_many process whole arrays with vectorized pointer jumping.
+    """
+
+    def __init__(self, n):
+        dtype = np.int32 if n <= np.iinfo(np.int32).max else np.int64
+        self.parent = np.arange(n, dtype=dtype)
+        self.size = np.ones(n, dtype=dtype)
+        self.count = n
+
+    def __len__(self):
+        return len(self.parent)
+
+    def find(self, u):
+        parent = self.parent
+        u = int(u)
+        while True:
+            p = int(parent[u])
+            if p == u:
+                return u
+            # Path halving: point u at its grandparent and continue from there
+            grandparent = int(parent[p])
+            parent[u] = grandparent
+            u = grandparent
+
+    def union(self, u, v):
+        root_u = self.find(u)
+        root_v = self.find(v)
+        if root_u == root_v:
+            return False
+        if self.size[root_u] < self.size[root_v]:
+            root_u, root_v = root_v, root_u
+        self.parent[root_v] = root_u
+        self.size[root_u] += self.size[root_v]
+        self.count -= 1
+        return True
+
+    def connected(self, u, v):
+        return self.find(u) == self.find(v)
+
+    def component_size(self, u):
+        return int(self.size[self.find(u)])
+
+    def find_many(self, items):
+        """Roots of an array of elements; every queried element is then pointed straight at its root"""
+        items = np.asarray(items)
+        parent = self.parent
+        roots = parent[items]
+        while True:
+            # Pointer jumping: every lookup moves all unfinished elements one level up
+            above = parent[roots]
+            moving = above != roots
+            if not moving.any():
+                break
+            roots = np.where(moving, above, roots)
+        parent[items] = roots
+        return roots
+
+    def union_many(self, us, vs):
+        """
+        Merge the components of every pair (us[i], vs[i]); returns the number of merges.
+        Each round hooks the smaller root (by size, then index) of every unmerged pair
+        under the larger one. That order is strict, so no cycles form even when a root
+        takes part in several pairs; pairs whose hook got overwritten retry next round.
+        """
+        us = np.asarray(us)
+        vs = np.asarray(vs)
+        merges = 0
+        while us.size:
+            root_u, root_v = self.find_many(us), self.find_many(vs)
+            apart = root_u != root_v
+            us, vs, root_u, root_v = us[apart], vs[apart], root_u[apart], root_v[apart]
+            if not us.size:
+                break
+            size = self.size
+            u_smaller = (size[root_u] < size[root_v]) | ((size[root_u] == size[root_v]) & (root_u < root_v))
+            child = np.where(u_smaller, root_u, root_v)
+            new_parent = np.where(u_smaller, root_v, root_u)
+            self.parent[child] = new_parent
+
+            # Credit each hooked root's old size to the root it ends up under
+            hooked = sorted_unique(child)
+            old_sizes = size[hooked]
+            np.add.at(size, self.find_many(hooked), old_sizes)
+            merges += hooked.size
+        self.count -= merges
+        return merges
+
+    def roots(self):
+        return np.flatnonzero(self.parent == np.arange(len(self.parent)))
+
+    def component_sizes(self):
+        """Sizes of all components, in root order"""
+        return self.size[self.roots()]
@@ -0,0 +1,17 @@
+"""
+Cross-lab imports. The lab folders are plain script directories; modules shared
+between labs (CSR graphs and graph files from lab3, priority queues from lab4,
+...) are found by appending the lab directories to sys.path, which keeps the
+current lab's own modules first. Lab scripts do `import lab_paths` before any
+such import; this file is made importable from every lab by installing the
+project once (pip install -e .), while benchmark.py and the tests find it at
+the repository root.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for _lab in ("lab3", "lab4", "lab5"):
+    _path = os.path.join(ROOT, _lab)
+    if _path not in sys.path:
+        sys.path.append(_path)
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+import lab_paths  # noqa: F401  (makes the lab3 modules importable)
+from csr_graph import CSRGraph
+from edge_generators import random_sparse_edges, tree_edges
+from bfs_engine import bfs, direction_optimizing_bfs, connected_components, BOTTOM_UP
+from parallel_bfs import ParallelBFS
+from hop_queries import HopQueryEngine
+
+
+def reference_bfs(graph, sources):
+    """Plain level-by-level BFS with the engines' parent rule (lowest-numbered parent)"""
+    n = graph.num_vertices
+    dist = np.full(n, -1, dtype=np.int32)
+    parent = np.full(n, -1, dtype=np.int32)
+    frontier = sorted(set(np.atleast_1d(sources).tolist()))
+    dist[frontier] = 0
+    parent[frontier] = frontier
+    level = 0
+    while frontier:
+        level += 1
+        found = {}
+        for u in frontier:
+            for v in graph.neighbors(u).tolist():
+                if dist[v] == -1 and v not in found:
+                    found[v] = u
+        for v, u in found.items():
+            dist[v], parent[v] = level, u
+        frontier = sorted(found)
+    return dist, parent
+
+
+def random_graph(rng, undirected):
+    n = int(rng.integers(2, 200))
+    m = int(rng.integers(1, 6 * n))
+    return CSRGraph.from_edges(n, rng.integers(0, n, m), rng.integers(0, n, m), undirected=undirected)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_undirected_matches_reference(seed):
+    rng = np.random.default_rng(seed)
+    graph = random_graph(rng, undirected=True)
+    sources = rng.integers(0, graph.num_vertices, 3)
+    # alpha=1 goes bottom-up as soon as the frontier is not tiny
+    dist, parent, _ = direction_optimizing_bfs(graph, sources, alpha=1)
+    expected_dist, expected_parent = reference_bfs(graph, sources)
+    assert np.array_equal(dist, expected_dist)
+    assert np.array_equal(parent, expected_parent)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_directed_with_reverse_graph_matches_reference(seed):
+    rng = np.random.default_rng(seed)
+    graph = random_graph(rng, undirected=False)
+    dist, parent, _ = direction_optimizing_bfs(graph, 0, alpha=1, reverse_graph=graph.transpose())
+    expected_dist, expected_parent = reference_bfs(graph, 0)
+    assert np.array_equal(dist, expected_dist)
+    assert np.array_equal(parent, expected_parent)
+
+
+def test_directed_bottom_up_step_is_taken():
+    # 0 -> 1..9 and 1..9 -> 10: level 2 runs bottom-up and must use in-edges of 10
+    sources = [0] * 9 + list(range(1, 10))
+    targets = list(range(1, 10)) + [10] * 9
+    graph = CSRGraph.from_edges(11, sources, targets, undirected=False)
+    dist, parent, directions = direction_optimizing_bfs(graph, 0, alpha=2, reverse_graph=graph.transpose())
+    assert BOTTOM_UP in directions
+    assert dist[10] == 2 and parent[10] == 1
+
+
+def test_empty_sources_raise():
+    graph = CSRGraph.from_edges(3, *tree_edges(3))
+    with pytest.raises(ValueError):
+        bfs(graph, [])
+
+
+def test_connected_components():
+    graph = CSRGraph.from_edges(6, [0, 1, 3], [1, 2, 4])
+    labels, count = connected_components(graph)
+    assert count == 3
+    assert labels.tolist() == [0, 0, 0, 1, 1, 2]
+
+
+def test_parallel_bfs_matches_sequential():
+    n = 3000
+    graph = CSRGraph.from_edges(n, *random_sparse_edges(n, 2, seed=4))
+    directed = CSRGraph.from_edges(n, *random_sparse_edges(n, 2, seed=5), undirected=False)
+    with ParallelBFS(graph, workers=2, min_parallel_edges=0) as engine:
+        for sources in (0, [0, n - 1]):
+            dist, parent = engine.run(sources)
+            expected_dist, expected_parent = bfs(graph, sources)
+            assert np.array_equal(dist, expected_dist)
+            assert np.array_equal(parent, expected_parent)
+    with ParallelBFS(directed, workers=2, min_parallel_edges=0) as engine:
+        dist, parent = engine.run(0)
+        expected_dist, expected_parent = bfs(directed, 0, reverse_graph=directed.transpose())
+        assert np.array_equal(dist, expected_dist)
+        assert np.array_equal(parent, expected_parent)
+
+
+def test_hop_queries_match_bfs():
+    rng = np.random.default_rng(0)
+    graph = random_graph(rng, undirected=False)
+    engine = HopQueryEngine(graph, graph.transpose())
+    for s, t in rng.integers(0, graph.num_vertices, (30, 2)).tolist():
+        hops, path, _ = engine.query(s, t)
+        dist, _ = reference_bfs(graph, s)
+        assert hops == dist[t]
+        if hops > 0:
+            assert path[0] == s and path[-1] == t and len(path) == hops + 1
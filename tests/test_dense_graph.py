@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+import lab_paths  # noqa: F401  (makes the lab3/lab4 modules importable)
+from csr_graph import CSRGraph
+from dense_graph import DenseGraph, random_dense_graph
+from floyd_warshall_numpy import floyd_warshall_numpy
+
+
+def test_open_restores_the_no_edge_sentinel(tmp_path):
+    path = str(tmp_path / "graph.npy")
+    graph = DenseGraph.create(path, 4, np.uint8, no_edge=0)
+    graph.weights[0, 1] = 3
+    graph.weights.flush()
+    del graph
+
+    reopened = DenseGraph.open(path)
+    assert reopened.no_edge == 0
+    assert floyd_warshall_numpy(reopened)[0].tolist() == [0, 3, np.inf, np.inf]
+
+
+@pytest.mark.parametrize("dtype, no_edge", [(np.uint16, None), (np.float32, -1)])
+def test_save_and_open_round_trip(tmp_path, dtype, no_edge):
+    graph = DenseGraph.from_matrix([[np.inf, 2], [5, np.inf]], dtype, no_edge)
+    path = str(tmp_path / "graph.npy")
+    graph.save(path)
+    reopened = DenseGraph.open(path)
+    assert reopened.no_edge == graph.no_edge
+    assert np.array_equal(reopened.rows(0, 2), graph.rows(0, 2))
+
+
+def test_from_matrix_rejects_weights_that_do_not_fit():
+    with pytest.raises(ValueError):
+        DenseGraph.from_matrix([[0, 300], [1, 0]], np.uint8)
+    with pytest.raises(ValueError):
+        DenseGraph.from_matrix([[0, 255], [1, 0]], np.uint8)
+
+
+def test_csr_round_trip_and_edge_counts():
+    graph = random_dense_graph(50, seed=1)
+    csr = graph.to_csr()
+    assert graph.count_edges() == csr.num_edges
+    assert np.array_equal(DenseGraph.from_csr(csr).rows(0, 50), graph.rows(0, 50))
+    assert isinstance(csr, CSRGraph)
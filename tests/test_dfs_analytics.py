@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+import lab_paths  # noqa: F401  (makes the lab3 modules importable)
+from csr_graph import CSRGraph
+from edge_generators import chain_edges, random_sparse_edges
+from graph_file import save_graph, open_graph
+from dfs_analytics import strongly_connected_components, bridges, articulation_points, topological_sort
+
+nx = pytest.importorskip("networkx")
+
+
+def random_edges(rng):
+    n = int(rng.integers(1, 40))
+    m = int(rng.integers(0, 2 * n + 1))
+    return n, rng.integers(0, n, m), rng.integers(0, n, m)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_directed_matches_networkx(seed):
+    n, u, v = random_edges(np.random.default_rng(seed))
+    graph = CSRGraph.from_edges(n, u, v, undirected=False)
+    reference = nx.DiGraph()
+    reference.add_nodes_from(range(n))
+    reference.add_edges_from(zip(u.tolist(), v.tolist()))
+
+    labels, count = strongly_connected_components(graph)
+    components = list(nx.strongly_connected_components(reference))
+    assert count == len(components)
+    for component in components:
+        assert len({labels[x] for x in component}) == 1
+    # Labels come out in reverse topological order of the condensation
+    for a, b in reference.edges():
+        assert labels[a] >= labels[b]
+
+    if nx.is_directed_acyclic_graph(reference):
+        position = {x: i for i, x in enumerate(topological_sort(graph).tolist())}
+        assert len(position) == n
+        assert all(position[a] < position[b] for a, b in reference.edges())
+    else:
+        with pytest.raises(ValueError):
+            topological_sort(graph)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_undirected_matches_networkx(seed):
+    n, u, v = random_edges(np.random.default_rng(seed))
+    keep = u != v
+    u, v = u[keep], v[keep]
+    graph = CSRGraph.from_edges(n, u, v)
+    reference = nx.Graph()
+    reference.add_nodes_from(range(n))
+    reference.add_edges_from(zip(u.tolist(), v.tolist()))
+
+    found = {tuple(sorted(edge)) for edge in bridges(graph).tolist()}
+    assert found == {tuple(sorted(edge)) for edge in nx.bridges(reference)}
+    assert set(articulation_points(graph).tolist()) == set(nx.articulation_points(reference))
+
+
+def test_long_chain_has_no_recursion_limit():
+    n = 200_000
+    graph = CSRGraph.from_edges(n, *chain_edges(n), undirected=False)
+    assert topological_sort(graph).tolist() == list(range(n))
+    assert len(bridges(CSRGraph.from_edges(n, *chain_edges(n)))) == n - 1
+
+
+def test_memmapped_graph_file(tmp_path):
+    n = 2000
+    graph = CSRGraph.from_edges(n, *random_sparse_edges(n, 2, seed=1), undirected=False)
+    path = str(tmp_path / "random.graph")
+    save_graph(path, graph, undirected=False)
+    mapped = open_graph(path)
+    assert isinstance(mapped.targets, np.memmap)
+    labels, count = strongly_connected_components(mapped)
+    expected_labels, expected_count = strongly_connected_components(graph)
+    assert count == expected_count
+    assert np.array_equal(labels, expected_labels)
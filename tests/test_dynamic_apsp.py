@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+import lab_paths  # noqa: F401  (makes the lab4 modules importable)
+from dynamic_apsp import DynamicAPSP
+from floyd_warshall_numpy import floyd_warshall_numpy
+
+
+@pytest.mark.parametrize("undirected", [False, True])
+@pytest.mark.parametrize("n", [2, 10, 40])
+def test_updates_match_recomputation(undirected, n):
+    rng = np.random.default_rng(n)
+    weights = np.where(rng.random((n, n)) < 0.2, rng.integers(1, 20, (n, n)).astype(np.float64), np.inf)
+    if undirected:
+        weights = np.minimum(weights, weights.T)
+    engine = DynamicAPSP(weights, undirected)
+    for _ in range(200):
+        u, v = rng.integers(0, n, 2).tolist()
+        engine.update_edge(u, v, rng.choice([np.inf, *range(25)]))
+        assert np.array_equal(engine.dist, floyd_warshall_numpy(engine.weights))
+
+
+def test_negative_weight_is_rejected():
+    engine = DynamicAPSP([[0, 1], [1, 0]])
+    with pytest.raises(ValueError):
+        engine.update_edge(0, 1, -1)
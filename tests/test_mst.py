@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+import lab_paths  # noqa: F401  (makes the lab3/lab4/lab5 modules importable)
+from csr_graph import CSRGraph
+from dense_graph import DenseGraph
+from kruskal import kruskal
+from prim import prim, prim_dense, prim_sparse
+from boruvka import boruvka
+
+nx = pytest.importorskip("networkx")
+
+
+def random_connected_edges(rng, n, extra):
+    # A random spanning tree plus extra random edges, with float weights
+    sources = np.concatenate((np.arange(1, n), rng.integers(0, n, extra)))
+    targets = np.concatenate((rng.integers(0, np.arange(1, n)), rng.integers(0, n, extra)))
+    # Each undirected pair once, so both directions get the same weight
+    pairs = np.unique(np.sort(np.column_stack((sources, targets)), axis=1), axis=0)
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    return pairs[:, 0], pairs[:, 1], rng.random(len(pairs))
+
+
+def networkx_mst_weight(n, sources, targets, weights):
+    reference = nx.Graph()
+    reference.add_nodes_from(range(n))
+    reference.add_weighted_edges_from(zip(sources.tolist(), targets.tolist(), weights.tolist()))
+    return nx.minimum_spanning_tree(reference).size(weight="weight")
+
+
+MST_FUNCTIONS = [kruskal, prim, boruvka, lambda graph: boruvka(graph, workers=2)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("mst", MST_FUNCTIONS)
+def test_csr_matches_networkx(seed, mst):
+    rng = np.random.default_rng(seed)
+    n = 300
+    sources, targets, weights = random_connected_edges(rng, n, 900)
+    graph = CSRGraph.from_edges(n, sources, targets, weights=weights)
+    u, v, w = mst(graph)
+    assert len(w) == n - 1
+    assert np.isclose(w.sum(), networkx_mst_weight(n, sources, targets, weights))
+
+
+@pytest.mark.parametrize("mst", MST_FUNCTIONS)
+def test_matrix_and_dense_graph_inputs(mst):
+    rng = np.random.default_rng(7)
+    n = 60
+    sources, targets, weights = random_connected_edges(rng, n, 400)
+    graph = CSRGraph.from_edges(n, sources, targets, weights=weights)
+    expected = networkx_mst_weight(n, sources, targets, weights)
+    dense = DenseGraph.from_csr(graph)
+    assert np.isclose(mst(dense)[2].sum(), expected)
+    assert np.isclose(mst(dense.weights.tolist())[2].sum(), expected)
+
+
+def test_prim_sparse_matches_prim_dense():
+    rng = np.random.default_rng(8)
+    n = 100
+    sources, targets, weights = random_connected_edges(rng, n, 300)
+    graph = CSRGraph.from_edges(n, sources, targets, weights=weights)
+    assert np.isclose(prim_sparse(graph)[2].sum(), prim_dense(DenseGraph.from_csr(graph))[2].sum())
+
+
+@pytest.mark.parametrize("mst", MST_FUNCTIONS)
+def test_unweighted_csr_counts_every_edge_as_one(mst):
+    n = 50
+    graph = CSRGraph.from_edges(n, np.arange(1, n), np.arange(n - 1))
+    assert mst(graph)[2].tolist() == [1.0] * (n - 1)
+
+
+@pytest.mark.parametrize("mst", MST_FUNCTIONS)
+def test_invalid_graphs_raise(mst):
+    directed = CSRGraph.from_edges(3, [0, 1], [1, 2], undirected=False, weights=np.ones(2))
+    with pytest.raises(ValueError):
+        mst(directed)
+    disconnected = CSRGraph.from_edges(4, [0, 2], [1, 3], weights=np.ones(2))
+    with pytest.raises(ValueError):
+        mst(disconnected)
+
+
+@pytest.mark.parametrize("mst", [prim, boruvka, lambda graph: boruvka(graph, workers=2)])
+def test_single_vertex_has_an_empty_mst(mst):
+    for graph in ([[np.inf]], CSRGraph.from_edges(1, [], [], weights=np.empty(0))):
+        u, v, w = mst(graph)
+        assert len(u) == len(v) == len(w) == 0
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+import lab_paths  # noqa: F401  (makes the lab3/lab4 modules importable)
+from csr_graph import CSRGraph
+from graph_file import save_graph, open_graph
+from dijkstra import dijkstra, dijkstra_sssp, matrix_to_csr
+from bellman_ford import bellman_ford, spfa, NegativeCycleError
+from floyd_warshall_numpy import floyd_warshall_numpy
+from blocked_floyd_warshall import blocked_floyd_warshall
+from parallel_dijkstra import parallel_dijkstra
+from johnson import johnson, all_pairs_shortest_paths
+from point_to_point import PointToPointEngine
+from contraction_hierarchy import ContractionHierarchy, grid_graph
+
+nx = pytest.importorskip("networkx")
+
+
+def random_matrix(rng, n, density=0.15, low=1, high=20):
+    weights = np.where(rng.random((n, n)) < density, rng.integers(low, high, (n, n)).astype(np.float64), np.inf)
+    np.fill_diagonal(weights, np.inf)
+    return weights
+
+
+def networkx_distances(weights):
+    n = len(weights)
+    reference = nx.DiGraph()
+    reference.add_nodes_from(range(n))
+    rows, cols = np.nonzero(np.isfinite(weights))
+    reference.add_weighted_edges_from(zip(rows.tolist(), cols.tolist(), weights[rows, cols].tolist()))
+    dist = np.full((n, n), np.inf)
+    for s, lengths in nx.all_pairs_bellman_ford_path_length(reference):
+        for t, d in lengths.items():
+            dist[s, t] = d
+    return dist
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_all_pairs_engines_match_networkx(seed):
+    weights = random_matrix(np.random.default_rng(seed), 40)
+    expected = networkx_distances(weights)
+    assert np.array_equal(dijkstra(weights), expected)
+    assert np.array_equal(floyd_warshall_numpy(weights), expected)
+    assert np.array_equal(blocked_floyd_warshall(weights, tile=16, workers=1), expected)
+    assert np.array_equal(blocked_floyd_warshall(weights, tile=16, workers=2), expected)
+    assert np.array_equal(johnson(weights), expected)
+    assert np.array_equal(parallel_dijkstra(weights, workers=2, block_size=8), expected)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_negative_weights_without_cycles(seed):
+    rng = np.random.default_rng(seed)
+    n = 30
+    # Edges only go from lower to higher vertices, so there is no cycle at all
+    weights = np.triu(random_matrix(rng, n, 0.3, -10, 20), 1)
+    weights[np.tril_indices(n)] = np.inf
+    weights[weights == 0] = np.inf
+    expected = networkx_distances(weights)
+    assert np.array_equal(johnson(weights), expected)
+    assert np.array_equal(all_pairs_shortest_paths(weights), expected)
+    assert np.array_equal(bellman_ford(weights, 0)[0], expected[0])
+    assert np.array_equal(spfa(weights, 0)[0], expected[0])
+
+
+def test_negative_cycle_is_reported():
+    weights = np.full((3, 3), np.inf)
+    weights[0, 1], weights[1, 2], weights[2, 0] = 1, -3, 1
+    for algorithm in (bellman_ford, spfa):
+        with pytest.raises(NegativeCycleError) as error:
+            algorithm(weights)
+        assert sorted(error.value.cycle) == [0, 1, 2]
+    with pytest.raises(NegativeCycleError):
+        johnson(weights)
+
+
+def test_negative_self_loop_is_a_cycle():
+    weights = np.full((2, 2), np.inf)
+    weights[0, 0], weights[0, 1] = -1, 2
+    with pytest.raises(NegativeCycleError) as error:
+        bellman_ford(weights)
+    assert error.value.cycle == [0]
+
+
+def test_unweighted_graph_file_has_unit_weights(tmp_path):
+    path = str(tmp_path / "chain.graph")
+    save_graph(path, CSRGraph.from_edges(5, [0, 1, 2], [1, 2, 3]))
+    graph = open_graph(path)
+    assert graph.weights is None
+    expected = [0, 1, 2, 3, np.inf]
+    assert dijkstra_sssp(graph, 0)[0].tolist() == expected
+    assert dijkstra(graph)[0].tolist() == expected
+    assert bellman_ford(graph, 0)[0].tolist() == expected
+    assert johnson(graph)[0].tolist() == expected
+    assert all_pairs_shortest_paths(graph)[0].tolist() == expected
+    assert PointToPointEngine(graph, num_landmarks=2, seed=0).query(0, 3)[0] == 3
+
+
+def test_dijkstra_rejects_negative_weights():
+    with pytest.raises(ValueError):
+        dijkstra_sssp(matrix_to_csr([[0, -1], [1, 0]]), 0)
+
+
+@pytest.mark.parametrize("method", ["bidirectional", "astar"])
+def test_point_to_point_matches_dijkstra(method):
+    rng = np.random.default_rng(1)
+    graph = matrix_to_csr(random_matrix(rng, 80, 0.05))
+    engine = PointToPointEngine(graph, num_landmarks=4, seed=0)
+    for s, t in rng.integers(0, 80, (40, 2)).tolist():
+        distance, path, _ = engine.query(s, t, method)
+        assert distance == dijkstra_sssp(graph, s)[0][t]
+        if np.isfinite(distance):
+            assert path[0] == s and path[-1] == t
+
+
+def test_contraction_hierarchy_matches_dijkstra():
+    rng = np.random.default_rng(2)
+    graph = grid_graph(12, seed=3)
+    hierarchy = ContractionHierarchy(graph)
+    for s, t in rng.integers(0, graph.num_vertices, (50, 2)).tolist():
+        distance, path, _ = hierarchy.query(s, t)
+        assert distance == dijkstra_sssp(graph, s)[0][t]
+        # The unpacked path walks original edges and adds up to the distance
+        assert path[0] == s and path[-1] == t
+        length = 0.0
+        for a, b in zip(path, path[1:]):
+            row = slice(graph.offsets[a], graph.offsets[a + 1])
+            length += graph.weights[row][graph.targets[row] == b].min()
+        assert length == distance